@@ -7,6 +7,10 @@ Just import this file in your main_controller.py
 
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Maximum seconds to wait for controller.ready before starting anyway
+READY_TIMEOUT = 30
 
 def auto_start_monitoring_and_containers(controller):
     """
@@ -14,14 +18,8 @@ def auto_start_monitoring_and_containers(controller):
     This is called AFTER your controller is fully initialized
     """
     
-    def delayed_startup():
-        """Run startup in a separate thread to avoid blocking"""
-        time.sleep(2)  # Wait for controller to be fully ready
-        
-        print("\n🚀 AUTO-STARTING Monitoring & Containers...")
-        print("=" * 50)
-        
-        # 1. Start Statistics Monitoring
+    def start_stats_monitoring():
+        """Start statistics monitoring"""
         try:
             if hasattr(controller, 'start_stats_monitoring'):
                 result = controller.start_stats_monitoring()
@@ -34,8 +32,9 @@ def auto_start_monitoring_and_containers(controller):
                 print("✅ Statistics monitoring: Started (manual integration)")
         except Exception as e:
             print(f"⚠️ Statistics monitoring failed: {e}")
-        
-        # 2. Start Container Monitoring
+    
+    def start_container_monitoring():
+        """Start Alpine containers for container monitoring"""
         try:
             from container_stats_addon import ContainerStatsAddon
             controller.container_addon = ContainerStatsAddon('./network_stats')
@@ -46,6 +45,24 @@ def auto_start_monitoring_and_containers(controller):
                 print("⚠️ Container monitoring: Failed to start containers")
         except Exception as e:
             print(f"⚠️ Container monitoring failed: {e}")
+    
+    def delayed_startup():
+        """Run startup in a separate thread to avoid blocking"""
+        # Wait until the controller's switches are connected (already true when called after initialize())
+        ready = getattr(controller, 'ready', None)
+        if ready is not None:
+            if not ready.wait(timeout=READY_TIMEOUT):
+                print(f"⚠️ Controller not ready after {READY_TIMEOUT}s, starting monitoring anyway")
+        else:
+            time.sleep(2)  # Older controllers without a ready event
+        
+        print("\n🚀 AUTO-STARTING Monitoring & Containers...")
+        print("=" * 50)
+        
+        # Statistics monitoring and containers are independent, start them in parallel
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            executor.submit(start_stats_monitoring)
+            executor.submit(start_container_monitoring)
         
         print("🎉 AUTO-START Complete!")
         print("📊 Dashboard: http://localhost:5000")
@@ -8,58 +8,91 @@ UPDATED VERSION with MONITORING TOGGLE and FIXED MEMORY PARSING
 import subprocess
 import time
 import csv
+import json
 import os
-import re
-from datetime import datetime
+import threading
+
+from docker_socket import docker_client
 
 # NEW: Import monitoring toggle
-from monitoring_toggle import print_container, print_important, print_error
+from monitoring_toggle import monitoring_toggle, print_container, print_important, print_error
+
+# Hosts and the Alpine container monitored on each
+MONITORED_CONTAINERS = [('h1', 'alpine_h1'), ('h3', 'alpine_h3')]
+
+# Container names are written into CSV rows unquoted
+assert all(',' not in container and '"' not in container for _, container in MONITORED_CONTAINERS)
+
+# dockerd's zero time, sent as the 'read' timestamp of samples for a stopped container
+_DOCKER_ZERO_TIME = '0001-01-01T00:00:00Z'
+
+# Seconds to wait for a newly started stats stream to deliver its first sample
+STREAM_FIRST_SAMPLE_TIMEOUT = 3
+
+# Seconds start_containers waits for both containers to show as running, and its poll interval
+START_VERIFY_TIMEOUT = 2
+START_VERIFY_POLL = 0.1
+
+# MB multiplier for each lowercased unit suffix docker stats prints ('3.57kib', '1.2mb', '0b')
+_UNIT_TO_MB = {
+    '': 1.0,
+    'b': 1 / (1024 * 1024),
+    **{prefix + suffix: scale
+       for prefix, scale in (('k', 1 / 1024), ('m', 1.0), ('g', 1024.0), ('t', 1024.0 * 1024))
+       for suffix in ('', 'i', 'b', 'ib')},
+}
+
+# Network values are decimal MB, matching the streamed byte counts / 1e6. docker's NetIO column prints
+# decimal sizes ('500kB', '1.2MB'); binary suffixes ('KiB') still scale by 1024
+_NET_UNIT_TO_MB = {
+    '': 1.0,
+    'b': 1e-6,
+    **{prefix + suffix: scale
+       for prefix, scale in (('k', 1e-3), ('m', 1.0), ('g', 1e3), ('t', 1e6))
+       for suffix in ('', 'b')},
+    **{prefix + suffix: scale
+       for prefix, scale in (('k', 1e-6 * 1024), ('m', 1e-6 * 1024 ** 2), ('g', 1e-6 * 1024 ** 3), ('t', 1e-6 * 1024 ** 4))
+       for suffix in ('i', 'ib')},
+}
+
+def _split_unit(value_str):
+    """Split '3.57KiB' into ('3.57', 'kib') by scanning back over the trailing unit letters"""
+    idx = len(value_str)
+    while idx > 0 and not (value_str[idx - 1].isdigit() or value_str[idx - 1] == '.'):
+        idx -= 1
+    return value_str[:idx], value_str[idx:].lower()
 
 def parse_memory_value_for_csv(memory_str):
     """Parse memory values like '3.57k', '2.4MiB' and convert to MB for CSV storage"""
-    if not memory_str or memory_str == '0' or memory_str == '':
+    if not memory_str or memory_str == '0' or memory_str == '0B':
         return 0.0
     
     memory_str = str(memory_str).strip()
     
-    # Handle plain numbers first (assume MB)
-    try:
-        return float(memory_str)
-    except:
-        pass
-    
-    # Handle units with regex - FIXED PARSING
-    match = re.match(r'([0-9.]+)([kmgtKMGT]?i?[Bb]?)', memory_str.lower())
-    if match:
-        value_str, unit = match.groups()
-        try:
-            value = float(value_str)
-            unit = unit.lower().replace('ib', '').replace('b', '')  # Remove 'iB' or 'B' suffixes
-            
-            # Convert to MB properly
-            if unit in ['k', 'ki']:
-                return value / 1024  # KB to MB: divide by 1024
-            elif unit in ['m', 'mi', '']:
-                return value  # Already MB or assume MB
-            elif unit in ['g', 'gi']:
-                return value * 1024  # GB to MB
-            elif unit in ['t', 'ti']:
-                return value * 1024 * 1024  # TB to MB
-            else:
-                return value  # Unknown unit, return as-is
-        except ValueError:
-            print_error(f"Warning: Could not parse memory numeric part: '{value_str}' from '{memory_str}'")
-            return 0.0
+    # Plain numbers (assume MB) end in a digit; only suffixed values need the unit split,
+    # so the common '2.4MiB' case never raises and catches a ValueError
+    if memory_str[-1:].isdigit() or memory_str[-1:] == '.':
+        value_str, unit = memory_str, ''
+    else:
+        value_str, unit = _split_unit(memory_str)
     
-    print_error(f"Warning: Could not parse memory value: '{memory_str}'")
-    return 0.0
+    # Handle units with a table lookup on the suffix - FIXED PARSING
+    try:
+        return float(value_str) * _UNIT_TO_MB.get(unit, 1.0)  # Unknown unit, return as-is
+    except ValueError:
+        print_error(f"Warning: Could not parse memory value: '{memory_str}'")
+        return 0.0
 
 def parse_cpu_percent_for_csv(cpu_str):
     """Parse CPU percentage values for CSV storage"""
-    if not cpu_str or cpu_str == '0' or cpu_str == '':
+    if not cpu_str or cpu_str == '0' or cpu_str == '0.00%':
         return 0.0
     
     try:
+        # docker prints '1.23%'; slice the trailing % off instead of scanning for it
+        cpu_str = str(cpu_str)
+        if cpu_str.endswith('%'):
+            return float(cpu_str[:-1])
         # Remove % symbol and any whitespace
         cpu_str = str(cpu_str).replace('%', '').strip()
         return float(cpu_str)
@@ -68,51 +101,107 @@ def parse_cpu_percent_for_csv(cpu_str):
         return 0.0
 
 def parse_network_value(net_str):
-    """Parse network values like '1.2MB', '500kB' to MB"""
-    if not net_str or net_str == '0' or net_str == '':
+    """Parse network values like '1.2MB', '500kB' to decimal MB"""
+    if not net_str or net_str == '0' or net_str == '0B':
         return 0.0
     
     net_str = str(net_str).strip()
     
-    # Handle plain numbers first (assume MB)
+    # Plain numbers (assume MB) skip the unit split, as in parse_memory_value_for_csv
+    if net_str[-1:].isdigit() or net_str[-1:] == '.':
+        value_str, unit = net_str, ''
+    else:
+        value_str, unit = _split_unit(net_str)
+    
+    # Handle units with a table lookup on the suffix
     try:
-        return float(net_str)
-    except:
-        pass
-    
-    # Handle units with regex
-    match = re.match(r'([0-9.]+)([kmgtKMGT]?[Bb]?)', net_str.lower())
-    if match:
-        value_str, unit = match.groups()
-        try:
-            value = float(value_str)
-            unit = unit.lower().replace('b', '')  # Remove 'B' suffix
-            
-            # Convert to MB
-            if unit == 'k':
-                return value / 1024  # KB to MB
-            elif unit == 'm' or unit == '':
-                return value  # Already MB or assume MB
-            elif unit == 'g':
-                return value * 1024  # GB to MB
-            else:
-                return value  # Unknown unit, return as-is
-        except ValueError:
-            return 0.0
+        return float(value_str) * _NET_UNIT_TO_MB.get(unit, 1.0)  # Unknown unit, return as-is
+    except ValueError:
+        return 0.0
+
+def stats_sample_values(stats):
+    """Convert a dockerd stats JSON sample to (cpu_percent, memory_mb, net_rx_mb, net_tx_mb)"""
+    # CPU% uses the same delta formula as `docker stats`
+    cpu_stats = stats.get('cpu_stats', {})
+    precpu_stats = stats.get('precpu_stats', {})
+    cpu_delta = cpu_stats.get('cpu_usage', {}).get('total_usage', 0) - precpu_stats.get('cpu_usage', {}).get('total_usage', 0)
+    system_delta = cpu_stats.get('system_cpu_usage', 0) - precpu_stats.get('system_cpu_usage', 0)
+    online_cpus = cpu_stats.get('online_cpus') or len(cpu_stats.get('cpu_usage', {}).get('percpu_usage') or []) or 1
+    cpu_percent = cpu_delta / system_delta * online_cpus * 100.0 if cpu_delta > 0 and system_delta > 0 else 0.0
     
-    return 0.0
+    # Memory excludes page cache, as `docker stats` does (cgroup v1 and v2 keys)
+    memory_stats = stats.get('memory_stats', {})
+    cache_stats = memory_stats.get('stats', {})
+    cache = cache_stats.get('total_inactive_file', cache_stats.get('inactive_file', 0))
+    memory_mb = max(memory_stats.get('usage', 0) - cache, 0) / (1024 * 1024)
+    
+    # Network bytes summed over interfaces, in decimal MB like parse_network_value's CLI values
+    networks = (stats.get('networks') or {}).values()
+    net_rx_mb = sum(net.get('rx_bytes', 0) for net in networks) / 1e6
+    net_tx_mb = sum(net.get('tx_bytes', 0) for net in networks) / 1e6
+    
+    return cpu_percent, memory_mb, net_rx_mb, net_tx_mb
+
+class ContainerSample:
+    """One container's converted stats for a collection cycle"""
+    __slots__ = ('status', 'cpu', 'memory', 'net_rx', 'net_tx')
+    
+    def __init__(self, status='unknown', cpu=0.0, memory=0.0, net_rx=0.0, net_tx=0.0):
+        self.status = status
+        self.cpu = cpu
+        self.memory = memory
+        self.net_rx = net_rx
+        self.net_tx = net_tx
 
 class ContainerStatsAddon:
     """Separate container monitoring addon with history logging and FIXED parsing"""
     
+    # Stats files already checked by init_csv; shared so later instances skip the stat/mkdir calls
+    _initialized_files = set()
+    
     def __init__(self, stats_dir='./network_stats'):
         self.stats_dir = stats_dir
         self.container_file = f"{stats_dir}/container_stats.csv"
+        self.latest_file = f"{stats_dir}/container_latest.json"
         self.container_history = f"./network_logs/container_history.csv"
+        self.summary_latest_file = "./network_logs/container_summary_latest.json"
         self.init_csv()
+        
+        # Latest streamed dockerd stats sample per host, filled by one reader thread per container
+        self.latest_stats = {}
+        self.stream_threads = {}
+        self.stream_lock = threading.Lock()
+        
+        # Container IDs printed by `docker run -d`, so API calls skip dockerd's name lookup
+        self.container_ids = {}
+        
+        # CSV files stay open between cycles; see _csv_handles()
+        self.container_fp = None
+        self.history_fp = None
+    
+    def _csv_handles(self):
+        """Open the CSV files for appending, reopening them if they were closed or deleted"""
+        for fp in (self.container_fp, self.history_fp):
+            if fp is None or fp.closed or os.fstat(fp.fileno()).st_nlink == 0:
+                self._close_csv_files()
+                ContainerStatsAddon._initialized_files.discard(self.container_file)  # A file may have been deleted
+                self.init_csv()
+                self.container_fp = open(self.container_file, 'a', newline='', buffering=1 << 16)
+                self.history_fp = open(self.container_history, 'a', newline='', buffering=1 << 16)
+                break
+    
+    def _close_csv_files(self):
+        """Flush and close the open CSV files"""
+        for fp in (self.container_fp, self.history_fp):
+            if fp is not None and not fp.closed:
+                fp.close()
+        self.container_fp = self.history_fp = None
     
     def init_csv(self):
         """Initialize container stats CSV files"""
+        if self.container_file in ContainerStatsAddon._initialized_files:
+            return
+        
         # Create stats directory
         os.makedirs(self.stats_dir, exist_ok=True)
         
@@ -128,27 +217,37 @@ class ContainerStatsAddon:
             with open(self.container_history, 'w', newline='') as f:
                 writer = csv.writer(f)
                 writer.writerow(['timestamp', 'total_containers', 'running_containers', 'avg_cpu_percent', 'total_memory_mb', 'h1_status', 'h3_status', 'h1_cpu', 'h3_cpu', 'h1_memory', 'h3_memory'])
+        
+        ContainerStatsAddon._initialized_files.add(self.container_file)
     
     def start_containers(self):
         """Start Alpine containers (fixed version)"""
         try:
             # Remove any existing containers first
-            subprocess.run("docker rm -f alpine_h1 alpine_h3 2>/dev/null", shell=True)
+            self._remove_containers()
             
             # Start containers normally (without netns)
-            cmd_h1 = "docker run -d --name alpine_h1 alpine:latest sleep 3600"
-            cmd_h3 = "docker run -d --name alpine_h3 alpine:latest sleep 3600"
+            cmd_h1 = ['docker', 'run', '-d', '--name', 'alpine_h1', 'alpine:latest', 'sleep', '3600']
+            cmd_h3 = ['docker', 'run', '-d', '--name', 'alpine_h3', 'alpine:latest', 'sleep', '3600']
             
-            result1 = subprocess.run(cmd_h1, shell=True, capture_output=True, text=True)
-            result2 = subprocess.run(cmd_h3, shell=True, capture_output=True, text=True)
+            # The two runs are independent, so start both before waiting on either
+            procs = [subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+                     for cmd in (cmd_h1, cmd_h3)]
+            outputs = [proc.communicate() for proc in procs]
+            result1, result2 = [subprocess.CompletedProcess(proc.args, proc.returncode, stdout, stderr)
+                                for proc, (stdout, stderr) in zip(procs, outputs)]
             
             if result1.returncode == 0 and result2.returncode == 0:
+                self.container_ids = {'h1': result1.stdout.strip(), 'h3': result2.stdout.strip()}
                 print_important("✅ Alpine containers started on h1 and h3")
                 
-                # Verify they're running
-                time.sleep(2)
-                check_result = subprocess.run("docker ps | grep alpine_", shell=True, capture_output=True, text=True)
-                if "alpine_h1" in check_result.stdout and "alpine_h3" in check_result.stdout:
+                # Verify they're running, polling instead of sleeping for the whole timeout
+                deadline = time.time() + START_VERIFY_TIMEOUT
+                running = self._running_container_names()
+                while not {"alpine_h1", "alpine_h3"} <= running and time.time() < deadline:
+                    time.sleep(START_VERIFY_POLL)
+                    running = self._running_container_names()
+                if "alpine_h1" in running and "alpine_h3" in running:
                     print_important("✅ Containers verified running")
                     return True
                 else:
@@ -166,116 +265,277 @@ class ContainerStatsAddon:
             print_error(f"❌ Container start failed: {e}")
             return False
     
-    def collect_container_stats(self):
-        """Collect stats from both containers with FIXED parsing"""
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    def _running_container_names(self):
+        """Names of running Alpine containers, from the Docker socket or else the CLI"""
+        try:
+            return set(docker_client.list_container_names('alpine_'))
+        except OSError:
+            result = subprocess.run(['docker', 'ps', '--filter', 'name=alpine_', '--format', '{{.Names}}'],
+                                   capture_output=True, text=True)
+            return set(result.stdout.split()) if result.returncode == 0 else set()
+    
+    def _ensure_stats_stream(self, host, container):
+        """Start a streaming stats reader for a running container if needed.
+        Returns an Event set on the new reader's first sample, or None if a reader was already running"""
+        with self.stream_lock:
+            thread = self.stream_threads.get(host)
+            if thread is None or not thread.is_alive():
+                first_sample = threading.Event()
+                thread = threading.Thread(target=self._stream_stats, args=(host, container, first_sample), daemon=True)
+                self.stream_threads[host] = thread
+                thread.start()
+            else:
+                first_sample = None
+        return first_sample
+    
+    def _stream_stats(self, host, container, first_sample):
+        """Keep the latest dockerd stats sample for one container until its stream ends"""
+        try:
+            # Fall back to the name for containers this instance did not start
+            container_ref = self.container_ids.get(host) or container
+            for sample in docker_client.stream_json(f'/containers/{container_ref}/stats?stream=true'):
+                # dockerd keeps the stream open after the container stops, sending empty samples
+                # until it is removed; stop reading so the next cycle reports it as stopped
+                if not sample.get('cpu_stats') or not sample.get('memory_stats') or sample.get('read') == _DOCKER_ZERO_TIME:
+                    break
+                self.latest_stats[host] = sample
+                first_sample.set()
+        except (OSError, ValueError) as e:
+            print_container(f"📊 {host}/{container}: stats stream ended ({e})")
+        finally:
+            self.latest_stats.pop(host, None)
+            first_sample.set()
+    
+    def _collect_from_streams(self):
+        """Container data from the streaming readers, or None if the Docker socket is unusable"""
+        # A reader exits on the first empty sample dockerd sends once its container stops, so live
+        # readers prove the containers are running; the container list is only fetched when a reader is missing
+        with self.stream_lock:
+            all_streaming = all(host in self.stream_threads and self.stream_threads[host].is_alive()
+                                for host, _ in MONITORED_CONTAINERS)
+        if all_streaming:
+            running = {container for _, container in MONITORED_CONTAINERS}
+        else:
+            try:
+                running = set(docker_client.list_container_names('alpine_'))
+            except OSError:
+                return None
+        
+        # Start every missing reader before waiting, so first samples arrive concurrently
+        # and a cycle waits at most one STREAM_FIRST_SAMPLE_TIMEOUT in total
+        first_samples = [self._ensure_stats_stream(host, container)
+                         for host, container in MONITORED_CONTAINERS if container in running]
+        deadline = time.time() + STREAM_FIRST_SAMPLE_TIMEOUT
+        for first_sample in first_samples:
+            if first_sample is not None:
+                first_sample.wait(timeout=max(deadline - time.time(), 0))
+        
         container_data = {}
+        for host, container in MONITORED_CONTAINERS:
+            if container not in running:
+                container_data[host] = ContainerSample('stopped')
+                continue
+            
+            sample = self.latest_stats.get(host)
+            if sample is None:
+                container_data[host] = ContainerSample('error')
+                continue
+            
+            cpu_mb, mem_mb, net_rx_mb, net_tx_mb = stats_sample_values(sample)
+            container_data[host] = ContainerSample('running', cpu_mb, mem_mb, net_rx_mb, net_tx_mb)
+            if monitoring_toggle.is_verbose():  # Skip formatting the message in quiet mode
+                print_container(f"📊 {host}/{container}: CPU {cpu_mb:.1f}%, MEM {mem_mb:.3f}MB (streamed)")
+        
+        return container_data
+    
+    def _collect_from_cli(self):
+        """Container data from one batched docker stats call, used when the Docker socket is unusable"""
+        container_data = {}
+        
+        try:
+            # One call samples just the monitored containers; a missing one makes docker exit non-zero
+            # but still prints rows for the others
+            result = subprocess.run(['docker', 'stats', '--no-stream', '--format', '{{.Name}}|{{.CPUPerc}}|{{.MemUsage}}|{{.NetIO}}|{{.PIDs}}',
+                                    *(container for _, container in MONITORED_CONTAINERS)],
+                                   capture_output=True, text=True, timeout=10)
+        except Exception as e:
+            print_error(f"⚠️ Error collecting container stats: {e}")
+            result = None
+        
+        rows = {}
+        if result is not None:
+            for line in result.stdout.strip().split('\n'):
+                data = line.strip().split('|')
+                if len(data) == 5:
+                    rows[data[0].strip()] = data
         
-        for host, container in [('h1', 'alpine_h1'), ('h3', 'alpine_h3')]:
+        if result is None or (result.returncode != 0 and not rows and 'No such container' not in result.stderr):
+            # Stats command failed
+            for host, container in MONITORED_CONTAINERS:
+                container_data[host] = ContainerSample('error')
+            return container_data
+        
+        for host, container in MONITORED_CONTAINERS:
+            data = rows.get(container)
+            if data is None or data[4].strip() == '0':
+                # Container missing, or named but stopped (no processes)
+                container_data[host] = ContainerSample('stopped')
+                continue
+            
             try:
-                # Check if container exists and is running
-                check_cmd = f"docker ps --filter name={container} --format '{{{{.Names}}}}'"
-                check_result = subprocess.run(check_cmd, shell=True, capture_output=True, text=True)
+                # FIXED: Properly parse and convert values
+                cpu_raw = data[1].strip()
+                mem_raw = data[2].split('/')[0].strip()
+                net_parts = data[3].split('/')
+                net_rx_raw = net_parts[0].strip()
+                net_tx_raw = net_parts[1].strip() if len(net_parts) > 1 else '0B'
+                
+                # Convert using FIXED parsing functions
+                cpu_mb = parse_cpu_percent_for_csv(cpu_raw)
+                mem_mb = parse_memory_value_for_csv(mem_raw)
+                net_rx_mb = parse_network_value(net_rx_raw)
+                net_tx_mb = parse_network_value(net_tx_raw)
+                
+                container_data[host] = ContainerSample('running', cpu_mb, mem_mb, net_rx_mb, net_tx_mb)
+                
+                # Show what was parsed
+                if monitoring_toggle.is_verbose():  # Skip formatting the message in quiet mode
+                    print_container(f"📊 {host}/{container}: CPU {cpu_mb:.1f}%, MEM {mem_mb:.3f}MB (from '{cpu_raw}'->'{mem_raw}')")
                 
-                if container in check_result.stdout:
-                    # Container is running, get stats
-                    stats_cmd = f"docker stats {container} --no-stream --format '{{{{.CPUPerc}}}}|{{{{.MemUsage}}}}|{{{{.NetIO}}}}'"
-                    result = subprocess.run(stats_cmd, shell=True, capture_output=True, text=True, timeout=5)
-                    
-                    if result.returncode == 0 and result.stdout.strip():
-                        data = result.stdout.strip().split('|')
-                        
-                        # FIXED: Properly parse and convert values
-                        cpu_raw = data[0].strip() if len(data) > 0 else '0%'
-                        mem_raw = data[1].split('/')[0].strip() if len(data) > 1 else '0MiB'
-                        net_parts = data[2].split('/') if len(data) > 2 else ['0B', '0B']
-                        net_rx_raw = net_parts[0].strip()
-                        net_tx_raw = net_parts[1].strip()
-                        
-                        # Convert using FIXED parsing functions
-                        cpu_mb = parse_cpu_percent_for_csv(cpu_raw)
-                        mem_mb = parse_memory_value_for_csv(mem_raw)
-                        net_rx_mb = parse_network_value(net_rx_raw)
-                        net_tx_mb = parse_network_value(net_tx_raw)
-                        
-                        container_data[host] = {
-                            'status': 'running', 
-                            'cpu': cpu_mb, 
-                            'memory': mem_mb, 
-                            'net_rx': net_rx_mb, 
-                            'net_tx': net_tx_mb
-                        }
-                        
-                        # Write to current CSV with CONVERTED values (not raw strings)
-                        with open(self.container_file, 'a', newline='') as f:
-                            writer = csv.writer(f)
-                            writer.writerow([timestamp, host, container, 'running', cpu_mb, mem_mb, net_rx_mb, net_tx_mb])
-                        
-                        # Show what was parsed
-                        print_container(f"📊 {host}/{container}: CPU {cpu_mb:.1f}%, MEM {mem_mb:.3f}MB (from '{cpu_raw}'->'{mem_raw}')")
-                    else:
-                        # Stats command failed
-                        container_data[host] = {'status': 'error', 'cpu': 0.0, 'memory': 0.0, 'net_rx': 0.0, 'net_tx': 0.0}
-                        with open(self.container_file, 'a', newline='') as f:
-                            writer = csv.writer(f)
-                            writer.writerow([timestamp, host, container, 'error', 0.0, 0.0, 0.0, 0.0])
-                else:
-                    # Container not running
-                    container_data[host] = {'status': 'stopped', 'cpu': 0.0, 'memory': 0.0, 'net_rx': 0.0, 'net_tx': 0.0}
-                    with open(self.container_file, 'a', newline='') as f:
-                        writer = csv.writer(f)
-                        writer.writerow([timestamp, host, container, 'stopped', 0.0, 0.0, 0.0, 0.0])
-                        
             except Exception as e:
                 print_error(f"⚠️ Error collecting {host} stats: {e}")
-                container_data[host] = {'status': 'error', 'cpu': 0.0, 'memory': 0.0, 'net_rx': 0.0, 'net_tx': 0.0}
+                container_data[host] = ContainerSample('error')
+        
+        return container_data
+    
+    def collect_container_stats(self):
+        """Collect stats from both containers with FIXED parsing"""
+        # Formatted once and shared by both CSVs; local time, as the existing rows use
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Streamed samples need no docker process per cycle; the CLI is the fallback
+        container_data = self._collect_from_streams()
+        if container_data is None:
+            container_data = self._collect_from_cli()
+        
+        self._csv_handles()
+        
+        # Write to current CSV with CONVERTED values (not raw strings); fields never need quoting.
+        # The cycle's rows go out as one block so readers never see half a cycle
+        rows = []
+        for host, container in MONITORED_CONTAINERS:
+            sample = container_data[host]
+            rows.append(f"{timestamp},{host},{container},{sample.status},{sample.cpu},{sample.memory},{sample.net_rx},{sample.net_tx}\r\n")
+        self.container_fp.write(''.join(rows))
         
         # Write to history log
-        self._log_container_history(timestamp, container_data)
+        summary = self._log_container_history(timestamp, container_data)
+        
+        # One flush per cycle makes the rows visible to the dashboard; batching across cycles
+        # would leave the dashboard's latest-row readers showing stale data
+        self.container_fp.flush()
+        self.history_fp.flush()
+        
+        self._write_latest_json(timestamp, container_data, summary)
+    
+    def _write_latest_json(self, timestamp, container_data, summary):
+        """Write this cycle's rows and summary as the dashboard's container route responses"""
+        payload = {'success': True, 'data': {
+            host: {
+                'timestamp': timestamp,
+                'host': host,
+                'container': container,
+                'status': container_data[host].status,
+                'cpu_percent': container_data[host].cpu,
+                'memory_mb': container_data[host].memory,
+                'network_rx_mb': container_data[host].net_rx,
+                'network_tx_mb': container_data[host].net_tx
+            }
+            for host, container in MONITORED_CONTAINERS
+        }}
+        self._write_json_atomic(self.latest_file, payload)
+        
+        # The dashboard serves this instead of re-reading the last line of the history CSV
+        if summary is not None:
+            self._write_json_atomic(self.summary_latest_file, {'success': True, 'data': summary})
+    
+    def _write_json_atomic(self, path, payload):
+        """Write payload as JSON beside path and rename it over path, so readers never see a partial file"""
+        try:
+            tmp_file = f"{path}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(payload, f)
+            os.replace(tmp_file, path)
+        except OSError as e:
+            print_error(f"❌ Error writing {path}: {e}")
     
     def _log_container_history(self, timestamp, container_data):
-        """Log aggregated container history with FIXED values"""
+        """Log aggregated container history with FIXED values; returns the logged row as a summary dict"""
         try:
             total_containers = len(container_data)
-            running_containers = sum(1 for data in container_data.values() if data['status'] == 'running')
+            running_containers = sum(1 for sample in container_data.values() if sample.status == 'running')
             
-            # Calculate averages using FIXED numeric values
-            cpus = []
-            memories = []
-            for data in container_data.values():
-                if isinstance(data['cpu'], (int, float)) and data['cpu'] > 0:
-                    cpus.append(data['cpu'])
-                if isinstance(data['memory'], (int, float)) and data['memory'] > 0:
-                    memories.append(data['memory'])
+            # Calculate averages; every ContainerSample holds floats, so no type checks are needed
+            cpus = [sample.cpu for sample in container_data.values() if sample.cpu > 0]
+            memories = [sample.memory for sample in container_data.values() if sample.memory > 0]
             
             avg_cpu = sum(cpus) / len(cpus) if cpus else 0.0
             total_memory = sum(memories) if memories else 0.0
             
             # Individual container data
-            h1_data = container_data.get('h1', {'status': 'unknown', 'cpu': 0.0, 'memory': 0.0})
-            h3_data = container_data.get('h3', {'status': 'unknown', 'cpu': 0.0, 'memory': 0.0})
+            h1_data = container_data.get('h1') or ContainerSample()
+            h3_data = container_data.get('h3') or ContainerSample()
             
-            with open(self.container_history, 'a', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    timestamp, total_containers, running_containers, 
-                    round(avg_cpu, 2), round(total_memory, 3),  # More precision for memory
-                    h1_data['status'], h3_data['status'], 
-                    round(h1_data['cpu'], 2), round(h3_data['cpu'], 2),
-                    round(h1_data['memory'], 3), round(h3_data['memory'], 3)
-                ])
+            summary = {
+                'timestamp': timestamp,
+                'total_containers': total_containers,
+                'running_containers': running_containers,
+                'avg_cpu_percent': round(avg_cpu, 2),
+                'total_memory_mb': round(total_memory, 3),  # More precision for memory
+                'h1_status': h1_data.status,
+                'h3_status': h3_data.status,
+                'h1_cpu': round(h1_data.cpu, 2),
+                'h3_cpu': round(h3_data.cpu, 2),
+                'h1_memory': round(h1_data.memory, 3),
+                'h3_memory': round(h3_data.memory, 3)
+            }
+            
+            # Same layout and \r\n terminator csv.writer produced; all fields are numbers or fixed words
+            self.history_fp.write(','.join(map(str, summary.values())) + '\r\n')
             
-            if running_containers > 0:
+            if running_containers > 0 and monitoring_toggle.is_verbose():  # Skip formatting the message in quiet mode
                 print_container(f"📚 Container history: {running_containers}/{total_containers} running, avg CPU {avg_cpu:.1f}%, total MEM {total_memory:.1f}MB")
             
+            return summary
+            
         except Exception as e:
             print_error(f"❌ Error logging container history: {e}")
+            return None
+    
+    def _join_stats_streams(self):
+        """Wait for the stats reader threads to finish once their containers are gone"""
+        with self.stream_lock:
+            threads = list(self.stream_threads.values())
+            self.stream_threads.clear()
+        for thread in threads:
+            thread.join(timeout=STREAM_FIRST_SAMPLE_TIMEOUT)
+    
+    def _remove_containers(self):
+        """Kill and remove the monitored containers over the Docker socket, falling back to the CLI"""
+        names = [container for _, container in MONITORED_CONTAINERS]
+        self.container_ids = {}
+        try:
+            for name in names:
+                docker_client.remove_container(name, force=True)
+        except OSError:
+            subprocess.run(['docker', 'rm', '-f'] + names,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
     
     def stop_containers(self):
         """Stop and remove containers"""
         try:
-            subprocess.run("docker stop alpine_h1 alpine_h3 2>/dev/null", shell=True)
-            subprocess.run("docker rm alpine_h1 alpine_h3 2>/dev/null", shell=True)
+            self._remove_containers()
+            self._join_stats_streams()
             print_important("🛑 Containers stopped and removed")
         except:
             pass
@@ -284,21 +544,32 @@ class ContainerStatsAddon:
         """Complete cleanup - containers, stats files, everything"""
         try:
             # Stop and remove containers
-            subprocess.run("docker stop alpine_h1 alpine_h3 2>/dev/null", shell=True)
-            subprocess.run("docker rm alpine_h1 alpine_h3 2>/dev/null", shell=True)
+            self._remove_containers()
+            self._join_stats_streams()
+            self._close_csv_files()
+            ContainerStatsAddon._initialized_files.discard(self.container_file)
             
             # Remove container stats file
             if os.path.exists(self.container_file):
                 os.remove(self.container_file)
                 print_important("🗑️ Container stats file removed")
             
+            # Remove latest-row JSON so the dashboard does not keep serving it
+            for latest_file in (self.latest_file, self.summary_latest_file):
+                if os.path.exists(latest_file):
+                    os.remove(latest_file)
+            
             # Remove container history file
             if os.path.exists(self.container_history):
                 os.remove(self.container_history)
                 print_important("🗑️ Container history file removed")
             
             # Clean up any orphaned containers
-            subprocess.run("docker container prune -f 2>/dev/null", shell=True)
+            try:
+                docker_client.prune_containers()
+            except OSError:
+                subprocess.run(['docker', 'container', 'prune', '-f'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             
             print_important("🧹 Complete container cleanup done")
         except Exception as e:
@@ -307,29 +578,10 @@ class ContainerStatsAddon:
     def get_container_status(self):
         """Get current container status for reporting"""
         try:
-            result = subprocess.run("docker ps --filter name=alpine_ --format '{{.Names}} {{.Status}}'", 
-                                   shell=True, capture_output=True, text=True)
-            
-            status_info = {}
-            if result.returncode == 0:
-                for line in result.stdout.strip().split('\n'):
-                    if line.strip():
-                        parts = line.split(' ', 1)
-                        if len(parts) >= 2:
-                            container_name = parts[0]
-                            status = parts[1]
-                            if 'alpine_h1' in container_name:
-                                status_info['h1'] = 'running'
-                            elif 'alpine_h3' in container_name:
-                                status_info['h3'] = 'running'
-            
-            # Default to stopped for any missing containers
-            if 'h1' not in status_info:
-                status_info['h1'] = 'stopped'
-            if 'h3' not in status_info:
-                status_info['h3'] = 'stopped'
-            
-            return status_info
+            # One set lookup per monitored container; missing containers default to stopped
+            running = self._running_container_names()
+            return {host: 'running' if container in running else 'stopped'
+                    for host, container in MONITORED_CONTAINERS}
             
         except Exception as e:
             print_error(f"⚠️ Error getting container status: {e}")
@@ -4,102 +4,16 @@ dashboard_container_api.py
 Add container stats to your dashboard - ADD THESE ROUTES TO YOUR DASHBOARD
 """
 
-import os
-import csv
-import json
-from flask import jsonify
+# The route handlers live in dashboard_container_extension.py; this file only shows how to wire them up
+from dashboard_container_extension import api_container_all, api_container_stats, api_container_summary
 
 # ADD THESE ROUTES TO YOUR dashboard_core.py or working_dashboard.py
 
-@app.route('/api/stats/containers')
-def api_container_stats():
-    """Get container statistics"""
-    try:
-        container_file = './network_stats/container_stats.csv'
-        
-        if os.path.exists(container_file):
-            # Read latest container stats
-            with open(container_file, 'r') as f:
-                lines = f.readlines()
-                if len(lines) > 1:  # Skip header
-                    # Get latest entries for each container
-                    h1_stats = None
-                    h3_stats = None
-                    
-                    # Read from end to get latest
-                    for line in reversed(lines[1:]):
-                        data = line.strip().split(',')
-                        if len(data) >= 8:
-                            host = data[1]
-                            if host == 'h1' and h1_stats is None:
-                                h1_stats = {
-                                    'timestamp': data[0],
-                                    'host': data[1],
-                                    'container': data[2],
-                                    'status': data[3],
-                                    'cpu_percent': float(data[4]) if data[4] != '0' else 0,
-                                    'memory_mb': float(data[5]) if data[5] != '0' else 0,
-                                    'network_rx_mb': float(data[6]) if data[6] != '0' else 0,
-                                    'network_tx_mb': float(data[7]) if data[7] != '0' else 0
-                                }
-                            elif host == 'h3' and h3_stats is None:
-                                h3_stats = {
-                                    'timestamp': data[0],
-                                    'host': data[1],
-                                    'container': data[2],
-                                    'status': data[3],
-                                    'cpu_percent': float(data[4]) if data[4] != '0' else 0,
-                                    'memory_mb': float(data[5]) if data[5] != '0' else 0,
-                                    'network_rx_mb': float(data[6]) if data[6] != '0' else 0,
-                                    'network_tx_mb': float(data[7]) if data[7] != '0' else 0
-                                }
-                    
-                    container_data = {}
-                    if h1_stats:
-                        container_data['h1'] = h1_stats
-                    if h3_stats:
-                        container_data['h3'] = h3_stats
-                    
-                    return jsonify({'success': True, 'data': container_data})
-        
-        return jsonify({'success': False, 'error': 'No container data available'})
-        
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+# app.add_url_rule('/api/stats/containers_all', view_func=api_container_all)
 
-@app.route('/api/stats/container_summary')
-def api_container_summary():
-    """Get container summary statistics"""
-    try:
-        history_file = './network_logs/container_history.csv'
-        
-        if os.path.exists(history_file):
-            with open(history_file, 'r') as f:
-                lines = f.readlines()
-                if len(lines) > 1:  # Skip header
-                    latest = lines[-1].strip().split(',')
-                    if len(latest) >= 11:
-                        return jsonify({
-                            'success': True,
-                            'data': {
-                                'timestamp': latest[0],
-                                'total_containers': int(latest[1]),
-                                'running_containers': int(latest[2]),
-                                'avg_cpu_percent': float(latest[3]),
-                                'total_memory_mb': float(latest[4]),
-                                'h1_status': latest[5],
-                                'h3_status': latest[6],
-                                'h1_cpu': float(latest[7]) if latest[7] != '0' else 0,
-                                'h3_cpu': float(latest[8]) if latest[8] != '0' else 0,
-                                'h1_memory': float(latest[9]) if latest[9] != '0' else 0,
-                                'h3_memory': float(latest[10]) if latest[10] != '0' else 0
-                            }
-                        })
-        
-        return jsonify({'success': False, 'error': 'No container summary available'})
-        
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+# Deprecated: the separate halves, kept for dashboards that still fetch them individually
+# app.add_url_rule('/api/stats/containers', view_func=api_container_stats)
+# app.add_url_rule('/api/stats/container_summary', view_func=api_container_summary)
 
 # ADD THIS JAVASCRIPT TO YOUR DASHBOARD HTML TEMPLATE:
 
@@ -108,17 +22,14 @@ CONTAINER_DASHBOARD_JS = '''
 
 async function updateContainerStats() {
     try {
-        // Get individual container stats
-        const containerResponse = await fetch('/api/stats/containers');
-        const containerData = await containerResponse.json();
+        // Get individual container stats and the summary in one request
+        const response = await fetch('/api/stats/containers_all');
+        const { containers: containerData, summary: summaryData } = await response.json();
         
         if (containerData.success && containerData.data) {
             updateContainerDisplay(containerData.data);
         }
         
-        // Get container summary
-        const summaryResponse = await fetch('/api/stats/container_summary');
-        const summaryData = await summaryResponse.json();
         
         if (summaryData.success && summaryData.data) {
             updateContainerSummary(summaryData.data);
@@ -204,9 +115,10 @@ CONTAINER_DASHBOARD_HTML = '''
 </div>
 '''
 
-print("📋 Dashboard Integration Instructions:")
-print("=" * 40)
-print("1. Add the two API routes (@app.route) to your dashboard file")
-print("2. Add the HTML section to your dashboard template")
-print("3. Add the JavaScript to your dashboard script section")
-print("4. Call updateContainerStats() in your main dashboard update loop")
+if __name__ == '__main__':
+    print("📋 Dashboard Integration Instructions:")
+    print("=" * 40)
+    print("1. Register the /api/stats/containers_all route (app.add_url_rule) in your dashboard file")
+    print("2. Add the HTML section to your dashboard template")
+    print("3. Add the JavaScript to your dashboard script section")
+    print("4. Call updateContainerStats() in your main dashboard update loop")
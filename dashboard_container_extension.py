@@ -7,107 +7,318 @@ Add container statistics to your existing dashboard WITHOUT modifying dashboard_
 import os
 import csv
 import json
+import mmap
+import re
 import subprocess
-from flask import jsonify
+import threading
+import time
+from flask import Response, request
 
-def add_container_routes_to_dashboard(app):
-    """
-    Add container statistics routes to your existing Flask dashboard app
-    Call this function in dashboard_core.py after creating the Flask app
-    """
+# orjson-backed when installed, stdlib json otherwise
+from dashboard_utils import json_bytes
+from monitoring_toggle import print_error
+
+# Latest rows as a ready-made JSON response, written by ContainerStatsAddon each cycle
+CONTAINER_LATEST_FILE = './network_stats/container_latest.json'
+CONTAINER_SUMMARY_LATEST_FILE = './network_logs/container_summary_latest.json'
+
+# Encoded once at import: the no-data bodies never change, and the routes return them on every miss
+_NO_CONTAINER_DATA_BODY = json_bytes({'success': False, 'error': 'No container data available'})
+_NO_CONTAINER_SUMMARY_BODY = json_bytes({'success': False, 'error': 'No container summary available'})
+
+# Response row for each monitored host in CSV field order; copied per parsed row
+_CONTAINER_ROW_TEMPLATES = {
+    host: {'timestamp': '', 'host': host, 'container': '', 'status': '', 'cpu_percent': 0.0,
+           'memory_mb': 0.0, 'network_rx_mb': 0.0, 'network_tx_mb': 0.0}
+    for host in ('h1', 'h3')
+}
+
+# Length of the collector's '%Y-%m-%d %H:%M:%S' timestamps, the first CSV field
+_TIMESTAMP_WIDTH = 19
+
+# Raw CSV host field -> host name, for filtering lines before they are parsed
+_CONTAINER_HOSTS = {host.encode(): host for host in _CONTAINER_ROW_TEMPLATES}
+
+# container_history.csv columns in order: (JSON key prefix, kind); numeric tokens are copied into the JSON verbatim
+_SUMMARY_FIELDS = tuple((f'"{name}":'.encode(), kind) for name, kind in (
+    ('timestamp', 'str'), ('total_containers', 'int'), ('running_containers', 'int'),
+    ('avg_cpu_percent', 'float'), ('total_memory_mb', 'float'), ('h1_status', 'str'), ('h3_status', 'str'),
+    ('h1_cpu', 'float'), ('h3_cpu', 'float'), ('h1_memory', 'float'), ('h3_memory', 'float'),
+))
+
+# A raw CSV token is only emitted as-is if it is already a valid JSON literal of the field's kind
+_JSON_TOKEN_PATTERNS = {
+    'int': re.compile(rb'-?(?:0|[1-9][0-9]*)'),
+    'float': re.compile(rb'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][+-]?[0-9]+)?'),
+}
+
+# Seconds between background refreshes of the encoded route responses
+SNAPSHOT_INTERVAL = 1.0
+
+# Latest encoded responses built by the poller; replaced as a whole, never mutated in place
+_route_snapshot = None
+_route_poller_thread = None
+_route_poller_lock = threading.Lock()
+
+# Parsed payloads keyed by path, reused while the file's mtime and size are unchanged
+_payload_cache = {}
+_payload_cache_lock = threading.Lock()
+
+def _cached_payload(path, build_payload):
+    """Return (build_payload(f), stat result) for the open file, rebuilding only after it changes; (None, None) if missing"""
+    # A single open replaces a separate stat, so the file cannot vanish between the check and the read
+    try:
+        f = open(path, 'rb')
+    except FileNotFoundError:
+        return None, None
     
-    @app.route('/api/stats/containers')
-    def api_container_stats():
-        """Get container statistics"""
-        try:
-            container_file = './network_stats/container_stats.csv'
-            
-            if os.path.exists(container_file):
-                # Read latest container stats
-                with open(container_file, 'r') as f:
-                    lines = f.readlines()
-                    if len(lines) > 1:  # Skip header
-                        # Get latest entries for each container
-                        h1_stats = None
-                        h3_stats = None
-                        
-                        # Read from end to get latest
-                        for line in reversed(lines[1:]):
-                            data = line.strip().split(',')
-                            if len(data) >= 8:
-                                host = data[1]
-                                if host == 'h1' and h1_stats is None:
-                                    h1_stats = {
-                                        'timestamp': data[0],
-                                        'host': data[1],
-                                        'container': data[2],
-                                        'status': data[3],
-                                        'cpu_percent': float(data[4]) if data[4] != '0' else 0,
-                                        'memory_mb': float(data[5]) if data[5] != '0' else 0,
-                                        'network_rx_mb': float(data[6]) if data[6] != '0' else 0,
-                                        'network_tx_mb': float(data[7]) if data[7] != '0' else 0
-                                    }
-                                elif host == 'h3' and h3_stats is None:
-                                    h3_stats = {
-                                        'timestamp': data[0],
-                                        'host': data[1],
-                                        'container': data[2],
-                                        'status': data[3],
-                                        'cpu_percent': float(data[4]) if data[4] != '0' else 0,
-                                        'memory_mb': float(data[5]) if data[5] != '0' else 0,
-                                        'network_rx_mb': float(data[6]) if data[6] != '0' else 0,
-                                        'network_tx_mb': float(data[7]) if data[7] != '0' else 0
-                                    }
-                        
-                        container_data = {}
-                        if h1_stats:
-                            container_data['h1'] = h1_stats
-                        if h3_stats:
-                            container_data['h3'] = h3_stats
-                        
-                        return jsonify({'success': True, 'data': container_data})
+    with f:
+        st = os.fstat(f.fileno())
+        key = (st.st_mtime_ns, st.st_size)
+        
+        with _payload_cache_lock:
+            cached = _payload_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1], st
+        
+        payload = build_payload(f, st)
+    with _payload_cache_lock:
+        _payload_cache[path] = (key, payload)
+    return payload, st
+
+def _conditional_response(response, st):
+    """Tag a response with its source file's version; clients that already have it get a bodiless 304"""
+    response.set_etag(f'{st.st_mtime_ns:x}-{st.st_size:x}')
+    response.last_modified = st.st_mtime
+    # Revalidate on every poll rather than letting the browser guess a freshness lifetime
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+def _iter_lines_reversed(mm):
+    """Yield the lines after the header of a memory-mapped CSV, last line first"""
+    header_end = mm.find(b'\n')
+    if header_end < 0:
+        return
+    # Each rfind is a C-level scan over the mapped bytes; only the yielded lines are copied
+    end = len(mm)
+    while end > header_end + 1:
+        start = mm.rfind(b'\n', header_end, end - 1) + 1
+        yield mm[start:end]
+        end = start
+
+def _read_container_stats(f, st):
+    """Latest row per container from an open container_stats.csv, or None if it has no data rows"""
+    if st.st_size == 0:
+        return None
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        has_rows = False
+        
+        # Get latest entries for each container
+        container_data = {}
+        
+        # Read from end to get latest, stopping as soon as every host has a row
+        for line in _iter_lines_reversed(mm):
+            has_rows = True
             
-            return jsonify({'success': False, 'error': 'No container data available'})
+            # Host check on the raw bytes first; the collector's fixed-width timestamp puts it at a known offset
+            if line.find(b',', 0, _TIMESTAMP_WIDTH + 1) == _TIMESTAMP_WIDTH and line[_TIMESTAMP_WIDTH + 3:_TIMESTAMP_WIDTH + 4] == b',':
+                host_field = line[_TIMESTAMP_WIDTH + 1:_TIMESTAMP_WIDTH + 3]
+            else:
+                fields = line.split(b',', 2)
+                host_field = fields[1] if len(fields) == 3 else None
+            if host_field not in _CONTAINER_HOSTS or _CONTAINER_HOSTS[host_field] in container_data:
+                continue
             
-        except Exception as e:
-            return jsonify({'success': False, 'error': str(e)})
+            # Unquoted rows need only a bounded split; csv.reader handles quoted fields
+            text = line.decode('utf-8', 'replace')
+            if b'"' in line:
+                data = next(csv.reader([text]), [])
+            else:
+                data = text.strip().split(',', 8)
+            if len(data) >= 8 and data[1] in _CONTAINER_ROW_TEMPLATES:
+                row = _CONTAINER_ROW_TEMPLATES[data[1]].copy()
+                row['timestamp'] = data[0]
+                row['container'] = data[2]
+                row['status'] = data[3]
+                row['cpu_percent'] = float(data[4] or 0)
+                row['memory_mb'] = float(data[5] or 0)
+                row['network_rx_mb'] = float(data[6] or 0)
+                row['network_tx_mb'] = float(data[7] or 0)
+                container_data[data[1]] = row
+                if len(container_data) == len(_CONTAINER_ROW_TEMPLATES):
+                    break
+    
+    if not has_rows:  # Header only
+        return None
+    
+    return container_data
+
+def _summary_tokens_json(fields):
+    """Encoded summary object built from raw CSV tokens, or None if any numeric token needs parsing"""
+    parts = []
+    for (key, kind), token in zip(_SUMMARY_FIELDS, fields):
+        if kind == 'str':
+            parts.append(key + json_bytes(token.decode('utf-8', 'replace')))
+        elif _JSON_TOKEN_PATTERNS[kind].fullmatch(token):
+            parts.append(key + token)
+        else:
+            return None
+    return b'{' + b','.join(parts) + b'}'
+
+def _read_container_summary(f, st):
+    """Latest summary row from an open container_history.csv as an encoded JSON object, or None if it has no complete data row"""
+    if st.st_size == 0:
+        return None
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # Only the last non-blank row is needed
+        line = next((line for line in _iter_lines_reversed(mm) if line.strip()), None)
+    
+    if line is None:
+        return None
+    
+    # The collector writes plain unquoted fields; splice its numbers straight into the JSON
+    if b'"' not in line:
+        fields = line.strip().split(b',')
+        if len(fields) >= 11:
+            encoded = _summary_tokens_json(fields)
+            if encoded is not None:
+                return encoded
+    
+    # Quoted, empty or otherwise unexpected fields go through the csv module and float()
+    latest = next(csv.reader([line.decode('utf-8', 'replace')]), [])
+    if len(latest) >= 11:
+        return json_bytes({
+            'timestamp': latest[0],
+            'total_containers': int(latest[1]),
+            'running_containers': int(latest[2]),
+            'avg_cpu_percent': float(latest[3]),
+            'total_memory_mb': float(latest[4]),
+            'h1_status': latest[5],
+            'h3_status': latest[6],
+            'h1_cpu': float(latest[7] or 0),
+            'h3_cpu': float(latest[8] or 0),
+            'h1_memory': float(latest[9] or 0),
+            'h3_memory': float(latest[10] or 0)
+        })
+    return None
+
+def _read_latest_body(path):
+    """(body, stat result) of a finished response file written by the collector, or None if missing"""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(), os.fstat(f.fileno())
+    except FileNotFoundError:
+        return None
+
+def _container_stats_body():
+    """Encoded /api/stats/containers response and the stat result of its source file (None on errors)"""
+    try:
+        # The collector writes the finished response every cycle; serve it as-is when present
+        latest = _read_latest_body(CONTAINER_LATEST_FILE)
+        if latest is not None:
+            return latest
+        
+        # Parsed once per change of the CSV; refreshes in between reuse the result
+        container_data, st = _cached_payload('./network_stats/container_stats.csv', _read_container_stats)
+        if container_data is not None:
+            return json_bytes({'success': True, 'data': container_data}), st
+        
+        return _NO_CONTAINER_DATA_BODY, None
+        
+    except Exception as e:
+        return json_bytes({'success': False, 'error': str(e)}), None
+
+def _container_summary_body():
+    """Encoded /api/stats/container_summary response and the stat result of its source file (None on errors)"""
+    try:
+        # Written by the collector with each history row; the CSV tail is the fallback
+        latest = _read_latest_body(CONTAINER_SUMMARY_LATEST_FILE)
+        if latest is not None:
+            return latest
+        
+        summary, st = _cached_payload('./network_logs/container_history.csv', _read_container_summary)
+        if summary is not None:
+            return b'{"success":true,"data":' + summary + b'}', st
+        
+        return _NO_CONTAINER_SUMMARY_BODY, None
+        
+    except Exception as e:
+        return json_bytes({'success': False, 'error': str(e)}), None
+
+def refresh_route_snapshot():
+    """Rebuild both encoded responses and publish them"""
+    global _route_snapshot
+    
+    containers = _container_stats_body()
+    summary = _container_summary_body()
+    snapshot = {
+        'containers': containers,
+        'summary': summary,
+        # Both bodies are already encoded, so the combined one is just spliced together
+        'all': (b'{"success":true,"containers":' + containers[0] + b',"summary":' + summary[0] + b'}', None),
+    }
+    # Publish by swapping the reference; readers never see a half-built snapshot
+    _route_snapshot = snapshot
+    return snapshot
+
+def get_route_snapshot():
+    """Return the latest snapshot, building one synchronously if the poller has not run yet"""
+    snapshot = _route_snapshot
+    if snapshot is None:
+        snapshot = refresh_route_snapshot()
+        # Started by the first request, so nothing polls until the dashboard is actually used
+        start_route_snapshot_poller()
+    return snapshot
 
-    @app.route('/api/stats/container_summary')
-    def api_container_summary():
-        """Get container summary statistics"""
+def _route_snapshot_poller():
+    """Background loop keeping the encoded responses fresh"""
+    while True:
         try:
-            history_file = './network_logs/container_history.csv'
-            
-            if os.path.exists(history_file):
-                with open(history_file, 'r') as f:
-                    lines = f.readlines()
-                    if len(lines) > 1:  # Skip header
-                        latest = lines[-1].strip().split(',')
-                        if len(latest) >= 11:
-                            return jsonify({
-                                'success': True,
-                                'data': {
-                                    'timestamp': latest[0],
-                                    'total_containers': int(latest[1]),
-                                    'running_containers': int(latest[2]),
-                                    'avg_cpu_percent': float(latest[3]),
-                                    'total_memory_mb': float(latest[4]),
-                                    'h1_status': latest[5],
-                                    'h3_status': latest[6],
-                                    'h1_cpu': float(latest[7]) if latest[7] != '0' else 0,
-                                    'h3_cpu': float(latest[8]) if latest[8] != '0' else 0,
-                                    'h1_memory': float(latest[9]) if latest[9] != '0' else 0,
-                                    'h3_memory': float(latest[10]) if latest[10] != '0' else 0
-                                }
-                            })
-            
-            return jsonify({'success': False, 'error': 'No container summary available'})
-            
+            refresh_route_snapshot()
         except Exception as e:
-            return jsonify({'success': False, 'error': str(e)})
+            print_error(f"⚠️ Container route snapshot refresh failed: {e}")
+        time.sleep(SNAPSHOT_INTERVAL)
+
+def start_route_snapshot_poller():
+    """Start the background snapshot poller once per process"""
+    global _route_poller_thread
+    
+    with _route_poller_lock:
+        if _route_poller_thread is None:
+            _route_poller_thread = threading.Thread(target=_route_snapshot_poller, daemon=True)
+            _route_poller_thread.start()
+
+def _snapshot_response(body, st):
+    """Response for a snapshot entry; conditional when it came from a file"""
+    response = Response(body, mimetype='application/json')
+    if st is None:
+        return response
+    return _conditional_response(response, st)
+
+def api_container_stats():
+    """Get container statistics (deprecated: use /api/stats/containers_all)"""
+    return _snapshot_response(*get_route_snapshot()['containers'])
+
+def api_container_summary():
+    """Get container summary statistics (deprecated: use /api/stats/containers_all)"""
+    return _snapshot_response(*get_route_snapshot()['summary'])
+
+def api_container_all():
+    """Get container statistics and summary in one response"""
+    return _snapshot_response(*get_route_snapshot()['all'])
+
+def add_container_routes_to_dashboard(app):
+    """
+    Add container statistics routes to your existing Flask dashboard app
+    Call this function in dashboard_core.py after creating the Flask app
+    """
+    app.add_url_rule('/api/stats/containers_all', view_func=api_container_all)
+    # Kept for older dashboards that still fetch the two halves separately
+    app.add_url_rule('/api/stats/containers', view_func=api_container_stats)
+    app.add_url_rule('/api/stats/container_summary', view_func=api_container_summary)
 
     print("🐳 Container statistics routes added to dashboard")
-    print("📊 Available at: /api/stats/containers and /api/stats/container_summary")
+    print("📊 Available at: /api/stats/containers_all (deprecated: /api/stats/containers, /api/stats/container_summary)")
 
 def get_container_dashboard_html():
     """
@@ -147,18 +358,14 @@ def get_container_dashboard_html():
 
 async function updateContainerStats() {
     try {
-        // Get individual container stats
-        const containerResponse = await fetch('/api/stats/containers');
-        const containerData = await containerResponse.json();
+        // Get individual container stats and the summary in one request
+        const response = await fetch('/api/stats/containers_all');
+        const { containers: containerData, summary: summaryData } = await response.json();
         
         if (containerData.success && containerData.data) {
             updateContainerDisplay(containerData.data);
         }
         
-        // Get container summary
-        const summaryResponse = await fetch('/api/stats/container_summary');
-        const summaryData = await summaryResponse.json();
-        
         if (summaryData.success && summaryData.data) {
             updateContainerSummary(summaryData.data);
         }
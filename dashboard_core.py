@@ -5,36 +5,104 @@ Main dashboard application with controller communication + Statistics + Neural O
 Admission control references removed
 """
 
-from flask import Flask, jsonify, render_template_string, request
+from flask import Flask, Response, request
+import gzip
+import hashlib
 import json
+import random
 import time
 import os
 import csv
 import subprocess
 import re
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import wraps
 
 # Import your original modules
 from dashboard_utils import get_controller_data, execute_command_via_controller
+# orjson-backed when installed; Flask's stdlib-json request parsing and jsonify are the fallback
+from dashboard_utils import ORJSON_AVAILABLE, json_bytes, json_loads, json_response
 from dashboard_topology import analyze_network_from_links, get_all_network_nodes_from_controller, generate_topology_svg
 from dashboard_templates import HTML_TEMPLATE
 
-# Add monitoring toggle support for quiet mode
+# Per-command trace output, enabled with DASH_DEBUG=1; the call sites check it first so the
+# trace messages are not even formatted when it is off
+DEBUG_OUTPUT = bool(os.environ.get('DASH_DEBUG'))
+
+# Stats errors repeat on every refresh while a switch or the controller is down; only shown in verbose mode
+try:
+    from monitoring_toggle import print_dashboard
+except ImportError:
+    def print_dashboard(msg):
+        print(msg)
+
+# waitress is a threaded production WSGI server with HTTP/1.1 keep-alive; optional, the
+# Flask development server (which closes every connection) is the fallback
+try:
+    from waitress import serve
+    WAITRESS_AVAILABLE = True
+except ImportError:
+    WAITRESS_AVAILABLE = False
+
+# Flask-Compress gzips/brotlis the JSON and HTML responses on the fly; optional, responses go out
+# uncompressed without it (the static /stats page is always available pre-compressed)
 try:
-    from monitoring_toggle import print_debug
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
 except ImportError:
-    def print_debug(msg):
-        pass  # Silent if monitoring_toggle not available
+    COMPRESS_AVAILABLE = False
 
 app = Flask(__name__)
 
-# Add container statistics routes 
-from dashboard_container_extension import add_container_routes_to_dashboard
+# jsonify (the fallback when orjson is missing) would otherwise sort every payload's keys;
+# app.json (the JSON provider) only exists from Flask 2.2, older releases read the config key
+if hasattr(app, 'json'):
+    app.json.sort_keys = False
+else:
+    app.config['JSON_SORT_KEYS'] = False
+
+if COMPRESS_AVAILABLE:
+    app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html']
+    app.config['COMPRESS_LEVEL'] = 4
+    Compress(app)
+
+# Add container statistics routes (the only ones registered for the /api/stats/container* URLs)
+from dashboard_container_extension import add_container_routes_to_dashboard, get_route_snapshot
 add_container_routes_to_dashboard(app)
 
-# Add the FIXED container routes (this will override the broken ones)
-from container_fix import create_fixed_container_api_routes
-create_fixed_container_api_routes(app)
 
+# Seconds a stats result is reused; the dashboard polls several cards at once and they share one refresh
+STATS_CACHE_TTL = 1.0
+
+# (monotonic time, result) per cached function, each with its own lock so a slow refresh blocks only its callers
+_stats_cache = {}
+_stats_cache_locks = {}
+
+def _ttl_cached(func):
+    """Reuse func()'s result for STATS_CACHE_TTL seconds; concurrent callers wait for one refresh"""
+    key = func.__name__
+    _stats_cache_locks[key] = threading.Lock()
+    
+    @wraps(func)
+    def wrapper():
+        cached = _stats_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < STATS_CACHE_TTL:
+            return cached[1]
+        
+        with _stats_cache_locks[key]:
+            # Another request may have refreshed it while this one waited for the lock
+            cached = _stats_cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < STATS_CACHE_TTL:
+                return cached[1]
+            result = func()
+            _stats_cache[key] = (time.monotonic(), result)
+            return result
+    
+    return wrapper
+
+@_ttl_cached
 def get_neural_optimizer_status():
     """Get neural optimizer status from controller"""
     try:
@@ -66,7 +134,7 @@ def get_neural_optimizer_status():
         }
         
     except Exception as e:
-        print(f"Error getting neural optimizer status: {e}")
+        print_dashboard(f"Error getting neural optimizer status: {e}")
         return {
             'available': False,
             'enabled': False,
@@ -76,92 +144,92 @@ def get_neural_optimizer_status():
             'status_text': 'ERROR'
         }
 
+# Switches polled for flow statistics, and a pool to query them concurrently
+TRAFFIC_SWITCHES = ['es1', 'es2', 'es3', 'es4']
+_switch_pool = ThreadPoolExecutor(max_workers=len(TRAFFIC_SWITCHES))
+
+# Stats reported for a switch that could not be queried; copied per use
+_ZERO_SWITCH_STATS = {
+    'total_packets': 0,
+    'total_bytes': 0,
+    'flow_count': 0,
+    'avg_packet_size': 0
+}
+
+# ovs-ofctl resolved against PATH once rather than on every call
+_OVS_OFCTL = shutil.which('ovs-ofctl') or 'ovs-ofctl'
+
+# A dump-flows line's counters; ovs-ofctl prints n_packets before n_bytes, and . stops at the line end
+_FLOW_COUNTERS_RE = re.compile(rb'n_packets=(\d+).*?n_bytes=(\d+)')
+
+def _get_switch_traffic_stats(switch):
+    """Flow statistics for one switch; zeros if the switch cannot be queried"""
+    try:
+        # Get flow statistics from OpenFlow; exec'd directly, no /bin/sh in between
+        result = subprocess.run([_OVS_OFCTL, 'dump-flows', switch], capture_output=True, timeout=5)
+        
+        if result.returncode == 0:
+            total_packets = 0
+            total_bytes = 0
+            flow_count = 0
+            
+            # One scan over the raw output; each match is one flow's packet and byte counters
+            for match in _FLOW_COUNTERS_RE.finditer(result.stdout):
+                flow_count += 1
+                total_packets += int(match.group(1))
+                total_bytes += int(match.group(2))
+            
+            return {
+                'total_packets': total_packets,
+                'total_bytes': total_bytes,
+                'flow_count': flow_count,
+                'avg_packet_size': total_bytes / total_packets if total_packets > 0 else 0
+            }
+            
+    except FileNotFoundError:
+        pass  # OVS not installed; the shell used to report this as a failed command, silently
+    except Exception as e:
+        print_dashboard(f"⚠️ Error getting stats for {switch}: {e}")
+    
+    return _ZERO_SWITCH_STATS.copy()
+
+@_ttl_cached
 def get_real_time_traffic_stats():
     """Get real-time traffic statistics from switches"""
     try:
-        switches = ['es1', 'es2', 'es3', 'es4']
-        traffic_data = {}
-        
-        for switch in switches:
-            try:
-                # Get flow statistics from OpenFlow
-                cmd = f"ovs-ofctl dump-flows {switch}"
-                result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=5)
-                
-                if result.returncode == 0:
-                    total_packets = 0
-                    total_bytes = 0
-                    flow_count = 0
-                    
-                    for line in result.stdout.split('\n'):
-                        if 'n_packets=' in line and 'n_bytes=' in line:
-                            flow_count += 1
-                            
-                            # Extract packet count
-                            packet_match = re.search(r'n_packets=(\d+)', line)
-                            if packet_match:
-                                total_packets += int(packet_match.group(1))
-                            
-                            # Extract byte count
-                            byte_match = re.search(r'n_bytes=(\d+)', line)
-                            if byte_match:
-                                total_bytes += int(byte_match.group(1))
-                    
-                    traffic_data[switch] = {
-                        'total_packets': total_packets,
-                        'total_bytes': total_bytes,
-                        'flow_count': flow_count,
-                        'avg_packet_size': total_bytes / total_packets if total_packets > 0 else 0
-                    }
-                else:
-                    traffic_data[switch] = {
-                        'total_packets': 0,
-                        'total_bytes': 0,
-                        'flow_count': 0,
-                        'avg_packet_size': 0
-                    }
-                    
-            except Exception as e:
-                print(f"⚠️ Error getting stats for {switch}: {e}")
-                traffic_data[switch] = {
-                    'total_packets': 0,
-                    'total_bytes': 0,
-                    'flow_count': 0,
-                    'avg_packet_size': 0
-                }
-        
-        return traffic_data
+        # The switches are queried in parallel, so a refresh takes as long as the slowest one
+        return dict(zip(TRAFFIC_SWITCHES, _switch_pool.map(_get_switch_traffic_stats, TRAFFIC_SWITCHES)))
         
     except Exception as e:
-        print(f"❌ Error getting traffic stats: {e}")
+        print_dashboard(f"❌ Error getting traffic stats: {e}")
         return {}
 
+# Baseline simulated latency (ms) per host pair
+SIMULATED_LATENCY_BASE = (
+    ('h1-h3', 2.3),  # Same pod, different subnet
+    ('h1-h5', 8.7),  # Cross-pod
+    ('h1-h7', 9.1),  # Cross-pod
+    ('h3-h5', 7.9),  # Cross-pod
+    ('h3-h7', 8.8),  # Cross-pod
+    ('h5-h7', 3.2),  # Same pod, different subnet
+    ('h2-h6', 8.4),  # Cross-pod
+    ('h4-h8', 9.3),  # Cross-pod
+)
+
+# Jitter source for the simulated latencies, created once with its bound method
+_latency_jitter = random.Random().uniform
+
 def get_real_time_latency_stats():
     """Get real-time latency with simulated data"""
     try:
-        # Provide realistic simulated latency data
-        import random
-        latency_data = {
-            'h1-h3': 2.3 + random.uniform(-0.5, 0.5),  # Same pod, different subnet
-            'h1-h5': 8.7 + random.uniform(-0.5, 0.5),  # Cross-pod
-            'h1-h7': 9.1 + random.uniform(-0.5, 0.5),  # Cross-pod
-            'h3-h5': 7.9 + random.uniform(-0.5, 0.5),  # Cross-pod  
-            'h3-h7': 8.8 + random.uniform(-0.5, 0.5),  # Cross-pod
-            'h5-h7': 3.2 + random.uniform(-0.5, 0.5),  # Same pod, different subnet
-            'h2-h6': 8.4 + random.uniform(-0.5, 0.5),  # Cross-pod
-            'h4-h8': 9.3 + random.uniform(-0.5, 0.5)   # Cross-pod
-        }
-        
-        # Ensure all values are positive
-        for pair in latency_data:
-            latency_data[pair] = max(0.1, latency_data[pair])
-        
-        return latency_data
+        # Provide realistic simulated latency data, kept positive
+        return {pair: max(0.1, base + _latency_jitter(-0.5, 0.5)) for pair, base in SIMULATED_LATENCY_BASE}
         
     except Exception as e:
-        print(f"❌ Error getting latency stats: {e}")
+        print_dashboard(f"❌ Error getting latency stats: {e}")
         return {}
 
+@_ttl_cached
 def get_network_health_stats():
     """Get network health from controller or use defaults"""
     try:
@@ -181,7 +249,7 @@ def get_network_health_stats():
             if 'links' in network_data:
                 links = network_data['links']
                 health_stats['total_links'] = len(links)
-                health_stats['links_up'] = sum(1 for status in links.values() if status)
+                health_stats['links_up'] = sum(map(bool, links.values()))
                 
                 if health_stats['total_links'] > 0:
                     health_stats['link_health'] = int((health_stats['links_up'] / health_stats['total_links']) * 100)
@@ -204,7 +272,7 @@ def get_network_health_stats():
         }
         
     except Exception as e:
-        print(f"❌ Error getting health stats: {e}")
+        print_dashboard(f"❌ Error getting health stats: {e}")
         return {
             'total_links': 20,
             'links_up': 20,
@@ -213,10 +281,75 @@ def get_network_health_stats():
             'overall_status': '🟢 HEALTHY'
         }
 
-@app.route('/stats')
-def stats_dashboard():
-    """Statistics dashboard page"""
-    return '''
+def summarize_latencies(latency_data):
+    """Best, worst and average of the positive pair latencies, or None if there are none"""
+    latencies = [latency for latency in latency_data.values() if latency > 0]
+    if not latencies:
+        return None
+    return {'min': min(latencies), 'max': max(latencies), 'avg': sum(latencies) / len(latencies)}
+
+# Seconds between background refreshes of the stats served by the /api/stats/* routes
+STATS_REFRESH_INTERVAL = 2.0
+
+# Latest stats built by the poller; replaced as a whole, never mutated in place
+_stats_snapshot = None
+_stats_poller_thread = None
+_stats_poller_lock = threading.Lock()
+
+def refresh_stats_snapshot():
+    """Collect every dashboard stat and publish them together"""
+    global _stats_snapshot
+    
+    latency_data = get_real_time_latency_stats()
+    snapshot = {
+        'traffic': get_real_time_traffic_stats(),
+        'latency': latency_data,
+        # Aggregated once per refresh instead of in every browser on every poll
+        'latency_summary': summarize_latencies(latency_data),
+        'health': get_network_health_stats(),
+        'neural': get_neural_optimizer_status(),
+    }
+    # /api/stats/all body minus the container part, encoded once per refresh rather than per request
+    snapshot['all_body'] = json_bytes({
+        'success': True,
+        'traffic': {'success': True, 'data': snapshot['traffic']},
+        'latency': {'success': True, 'data': snapshot['latency'], 'summary': snapshot['latency_summary']},
+        'health': {'success': True, 'data': snapshot['health']},
+        'neural': {'success': True, 'data': snapshot['neural']},
+    })
+    # Publish by swapping the reference; readers never see a half-built snapshot
+    _stats_snapshot = snapshot
+    return snapshot
+
+def get_stats_snapshot():
+    """Return the latest stats, collecting them synchronously if the poller has not run yet"""
+    snapshot = _stats_snapshot
+    if snapshot is None:
+        snapshot = refresh_stats_snapshot()
+    return snapshot
+
+def _stats_snapshot_poller():
+    """Background loop keeping the stats fresh, so requests never wait on ovs-ofctl"""
+    while True:
+        try:
+            refresh_stats_snapshot()
+        except Exception as e:
+            print_dashboard(f"⚠️ Stats snapshot refresh failed: {e}")
+        time.sleep(STATS_REFRESH_INTERVAL)
+
+def start_stats_snapshot_poller():
+    """Start the background stats poller once per process"""
+    global _stats_poller_thread
+    
+    with _stats_poller_lock:
+        if _stats_poller_thread is None:
+            _stats_poller_thread = threading.Thread(target=_stats_snapshot_poller, daemon=True)
+            _stats_poller_thread.start()
+
+start_stats_snapshot_poller()
+
+# Statistics dashboard page; static, so it is encoded and tagged once at import
+STATS_PAGE_HTML = '''
 <!DOCTYPE html>
 <html>
 <head>
@@ -380,51 +513,52 @@ def stats_dashboard():
             async function updateNeuralOptimizerStatus() {
                 try {
                     const response = await fetch('/api/stats/neural_optimizer');
-                    const data = await response.json();
+                    renderNeuralOptimizerStatus(await response.json());
+                } catch (error) {
+                    console.error('Error updating neural optimizer status:', error);
+                }
+            }
+            
+            function renderNeuralOptimizerStatus(data) {
+                if (data.success && data.data) {
+                    const neural = data.data;
                     
-                    if (data.success && data.data) {
-                        const neural = data.data;
-                        
-                        // Update status indicator
-                        const indicator = document.getElementById('neural-indicator');
-                        const statusText = document.getElementById('neural-status');
-                        const toggleBtn = document.getElementById('neural-toggle-btn');
-                        
-                        if (neural.enabled) {
-                            indicator.className = 'neural-status-indicator neural-status-enabled';
-                            statusText.textContent = 'ENABLED';
-                            statusText.style.color = '#4CAF50';
-                            toggleBtn.textContent = 'Disable';
-                            toggleBtn.style.background = '#F44336';
-                        } else {
-                            indicator.className = 'neural-status-indicator neural-status-disabled';
-                            statusText.textContent = 'DISABLED';
-                            statusText.style.color = '#F44336';
-                            toggleBtn.textContent = 'Enable';
-                            toggleBtn.style.background = '#4CAF50';
-                        }
-                        
-                        // Update details
-                        document.getElementById('neural-tensorflow').textContent = neural.tensorflow_available ? 'Available' : 'Missing';
-                        document.getElementById('neural-active').textContent = neural.active ? 'Running' : 'Idle';
-                        document.getElementById('neural-available').textContent = neural.available ? 'Yes' : 'No';
-                        
-                        if (!neural.available) {
-                            toggleBtn.style.display = 'none';
-                        }
-                        
+                    // Update status indicator
+                    const indicator = document.getElementById('neural-indicator');
+                    const statusText = document.getElementById('neural-status');
+                    const toggleBtn = document.getElementById('neural-toggle-btn');
+                    
+                    if (neural.enabled) {
+                        indicator.className = 'neural-status-indicator neural-status-enabled';
+                        statusText.textContent = 'ENABLED';
+                        statusText.style.color = '#4CAF50';
+                        toggleBtn.textContent = 'Disable';
+                        toggleBtn.style.background = '#F44336';
                     } else {
-                        // Unknown status
-                        const indicator = document.getElementById('neural-indicator');
-                        const statusText = document.getElementById('neural-status');
-                        indicator.className = 'neural-status-indicator neural-status-unknown';
-                        statusText.textContent = 'UNKNOWN';
-                        statusText.style.color = '#9E9E9E';
-                        document.getElementById('neural-toggle-btn').style.display = 'none';
+                        indicator.className = 'neural-status-indicator neural-status-disabled';
+                        statusText.textContent = 'DISABLED';
+                        statusText.style.color = '#F44336';
+                        toggleBtn.textContent = 'Enable';
+                        toggleBtn.style.background = '#4CAF50';
                     }
                     
-                } catch (error) {
-                    console.error('Error updating neural optimizer status:', error);
+                    // Update details
+                    document.getElementById('neural-tensorflow').textContent = neural.tensorflow_available ? 'Available' : 'Missing';
+                    document.getElementById('neural-active').textContent = neural.active ? 'Running' : 'Idle';
+                    document.getElementById('neural-available').textContent = neural.available ? 'Yes' : 'No';
+                    
+                    if (!neural.available) {
+                        toggleBtn.style.display = 'none';
+                    }
+                    
+                } else {
+                    // Unknown status
+                    const indicator = document.getElementById('neural-indicator');
+                    const statusText = document.getElementById('neural-status');
+                    indicator.className = 'neural-status-indicator neural-status-unknown';
+                    statusText.textContent = 'UNKNOWN';
+                    statusText.style.color = '#9E9E9E';
+                    document.getElementById('neural-toggle-btn').style.display = 'none';
                 }
             }
             
@@ -459,9 +593,12 @@ def stats_dashboard():
             
             async function updateStats() {
                 try {
+                    // Every section comes from one request
+                    const response = await fetch('/api/stats/all');
+                    const stats = await response.json();
+                    
                     // Update traffic statistics
-                    const trafficResponse = await fetch('/api/stats/traffic');
-                    const trafficData = await trafficResponse.json();
+                    const trafficData = stats.traffic;
                     
                     if (trafficData.success && trafficData.data) {
                         const data = trafficData.data;
@@ -499,15 +636,15 @@ def stats_dashboard():
                     }
                     
                     // Update latency statistics
-                    const latencyResponse = await fetch('/api/stats/latency');
-                    const latencyData = await latencyResponse.json();
+                    const latencyData = stats.latency;
                     
                     if (latencyData.success && latencyData.data) {
-                        const latencies = Object.values(latencyData.data).filter(l => l > 0);
-                        if (latencies.length > 0) {
-                            const avgLatency = latencies.reduce((a, b) => a + b, 0) / latencies.length;
-                            const minLatency = Math.min(...latencies);
-                            const maxLatency = Math.max(...latencies);
+                        // Best/worst/average come precomputed from the server
+                        const summary = latencyData.summary;
+                        if (summary) {
+                            const avgLatency = summary.avg;
+                            const minLatency = summary.min;
+                            const maxLatency = summary.max;
                             
                             document.getElementById('avg-latency').textContent = avgLatency.toFixed(2);
                             document.getElementById('best-latency').textContent = minLatency.toFixed(2);
@@ -530,8 +667,7 @@ def stats_dashboard():
                     }
                     
                     // Update health statistics
-                    const healthResponse = await fetch('/api/stats/health');
-                    const healthData = await healthResponse.json();
+                    const healthData = stats.health;
                     
                     if (healthData.success && healthData.data) {
                         const data = healthData.data;
@@ -544,10 +680,10 @@ def stats_dashboard():
                     }
                     
                     // Update neural optimizer status
-                    await updateNeuralOptimizerStatus();
+                    renderNeuralOptimizerStatus(stats.neural);
                     
                     // Update container statistics
-                    await updateContainerStats();
+                    renderContainerStats(stats.containers);
                     
                 } catch (error) {
                     console.error('Error updating stats:', error);
@@ -557,62 +693,9 @@ def stats_dashboard():
             
             async function updateContainerStats() {
                 try {
-                    // Get container summary first
-                    const summaryResponse = await fetch('/api/stats/container_summary');
-                    const summaryData = await summaryResponse.json();
-                    
-                    if (summaryData.success && summaryData.data) {
-                        const summary = summaryData.data;
-                        
-                        // Update summary metrics
-                        const runningElement = document.getElementById('running-containers');
-                        const cpuElement = document.getElementById('avg-container-cpu');
-                        const memoryElement = document.getElementById('total-container-memory');
-                        const h1Element = document.getElementById('h1-container-status');
-                        const h3Element = document.getElementById('h3-container-status');
-                        
-                        if (runningElement) runningElement.textContent = `${summary.running_containers}/${summary.total_containers}`;
-                        if (cpuElement) cpuElement.textContent = summary.avg_cpu_percent.toFixed(1) + '%';
-                        if (memoryElement) memoryElement.textContent = summary.total_memory_mb.toFixed(1) + ' MB';
-                        if (h1Element) h1Element.textContent = summary.h1_status;
-                        if (h3Element) h3Element.textContent = summary.h3_status;
-                    }
-                    
-                    // Get individual container stats
-                    const containerResponse = await fetch('/api/stats/containers');
-                    const containerData = await containerResponse.json();
-                    
-                    const containerDetailsElement = document.getElementById('container-details');
-                    if (containerDetailsElement) {
-                        if (containerData.success && containerData.data) {
-                            let containerHtml = '';
-                            
-                            Object.entries(containerData.data).forEach(([host, stats]) => {
-                                const statusColor = stats.status === 'running' ? '#4CAF50' : '#F44336';
-                                const statusIcon = stats.status === 'running' ? '🟢' : '🔴';
-                                
-                                containerHtml += `
-                                    <div style="margin-bottom: 8px; padding: 8px; background: rgba(255,255,255,0.05); border-radius: 5px; border-left: 4px solid ${statusColor};">
-                                        <strong>${statusIcon} ${host.toUpperCase()} Container:</strong><br>
-                                        <small>Status: ${stats.status} | CPU: ${stats.cpu_percent.toFixed(1)}% | Memory: ${stats.memory_mb.toFixed(1)}MB</small>
-                                    </div>
-                                `;
-                            });
-                            
-                            containerDetailsElement.innerHTML = containerHtml;
-                            addActivity(`Container stats: ${Object.keys(containerData.data).length} containers monitored`, 'success');
-                        } else {
-                            // Show helpful error message
-                            const errorMsg = containerData.error || 'Container data not available';
-                            containerDetailsElement.innerHTML = `
-                                <div style="color: #FF9800; padding: 10px; border-left: 3px solid #FF9800; background: rgba(255,152,0,0.1);">
-                                    ⚠️ ${errorMsg}<br>
-                                    <small>To fix: Run 'python3 container_stats_addon.py' to start container monitoring</small>
-                                </div>
-                            `;
-                        }
-                    }
-                    
+                    // Get container summary and per-container stats in one request
+                    const allResponse = await fetch('/api/stats/containers_all');
+                    renderContainerStats(await allResponse.json());
                 } catch (error) {
                     console.error('Error updating container stats:', error);
                     const containerDetailsElement = document.getElementById('container-details');
@@ -627,70 +710,160 @@ def stats_dashboard():
                 }
             }
             
+            function renderContainerStats(allData) {
+                const summaryData = allData.summary;
+                const containerData = allData.containers;
+                
+                if (summaryData.success && summaryData.data) {
+                    const summary = summaryData.data;
+                    
+                    // Update summary metrics
+                    const runningElement = document.getElementById('running-containers');
+                    const cpuElement = document.getElementById('avg-container-cpu');
+                    const memoryElement = document.getElementById('total-container-memory');
+                    const h1Element = document.getElementById('h1-container-status');
+                    const h3Element = document.getElementById('h3-container-status');
+                    
+                    if (runningElement) runningElement.textContent = `${summary.running_containers}/${summary.total_containers}`;
+                    if (cpuElement) cpuElement.textContent = summary.avg_cpu_percent.toFixed(1) + '%';
+                    if (memoryElement) memoryElement.textContent = summary.total_memory_mb.toFixed(1) + ' MB';
+                    if (h1Element) h1Element.textContent = summary.h1_status;
+                    if (h3Element) h3Element.textContent = summary.h3_status;
+                }
+                
+                // Individual container stats
+                const containerDetailsElement = document.getElementById('container-details');
+                if (containerDetailsElement) {
+                    if (containerData.success && containerData.data) {
+                        const entries = Object.entries(containerData.data);
+                        const rows = entries.map(([host, stats]) => {
+                            const running = stats.status === 'running';
+                            const statusColor = running ? '#4CAF50' : '#F44336';
+                            const statusIcon = running ? '🟢' : '🔴';
+                            
+                            return `
+                                <div style="margin-bottom: 8px; padding: 8px; background: rgba(255,255,255,0.05); border-radius: 5px; border-left: 4px solid ${statusColor};">
+                                    <strong>${statusIcon} ${host.toUpperCase()} Container:</strong><br>
+                                    <small>Status: ${stats.status} | CPU: ${stats.cpu_percent.toFixed(1)}% | Memory: ${stats.memory_mb.toFixed(1)}MB</small>
+                                </div>
+                            `;
+                        });
+                        
+                        // One DOM write for the whole list
+                        containerDetailsElement.innerHTML = rows.join('');
+                        addActivity(`Container stats: ${entries.length} containers monitored`, 'success');
+                    } else {
+                        // Show helpful error message
+                        const errorMsg = containerData.error || 'Container data not available';
+                        containerDetailsElement.innerHTML = `
+                            <div style="color: #FF9800; padding: 10px; border-left: 3px solid #FF9800; background: rgba(255,152,0,0.1);">
+                                ⚠️ ${errorMsg}<br>
+                                <small>To fix: Run 'python3 container_stats_addon.py' to start container monitoring</small>
+                            </div>
+                        `;
+                    }
+                }
+            }
+            
+            // Poll only while the tab is visible; catch up immediately when it is shown again
+            let statsTimer = null;
+            
+            function startPolling() {
+                if (statsTimer === null) {
+                    updateStats();
+                    statsTimer = setInterval(updateStats, 5000);
+                }
+            }
+            
+            function stopPolling() {
+                clearInterval(statsTimer);
+                statsTimer = null;
+            }
+            
+            document.addEventListener('visibilitychange', function() {
+                if (document.hidden) {
+                    stopPolling();
+                } else {
+                    startPolling();
+                }
+            });
+            
             // Initialize
             document.addEventListener('DOMContentLoaded', function() {
                 addActivity('Statistics dashboard started', 'success');
-                updateStats();
-                setInterval(updateStats, 5000);
+                startPolling();
             });
         </script>
     </div>
 </body>
 </html>
     '''
+_STATS_PAGE = STATS_PAGE_HTML.encode('utf-8')
+_STATS_PAGE_ETAG = hashlib.blake2b(_STATS_PAGE).hexdigest()[:16]
+_STATS_PAGE_GZ = gzip.compress(_STATS_PAGE, 6)
+
+@app.route('/stats')
+def stats_dashboard():
+    """Statistics dashboard page"""
+    if request.accept_encodings.quality('gzip') > 0:
+        response = Response(_STATS_PAGE_GZ, mimetype='text/html')
+        response.headers['Content-Encoding'] = 'gzip'
+        # Each encoding is a different representation, so it gets its own tag
+        response.set_etag(_STATS_PAGE_ETAG + '-gz')
+    else:
+        response = Response(_STATS_PAGE, mimetype='text/html')
+        response.set_etag(_STATS_PAGE_ETAG)
+    response.vary.add('Accept-Encoding')
+    # Browsers revalidating an unchanged page get a bodiless 304
+    return response.make_conditional(request)
 
 @app.route('/api/stats/neural_optimizer')
 def api_neural_optimizer_status():
     """Get neural optimizer status"""
     try:
-        neural_status = get_neural_optimizer_status()
-        return jsonify({'success': True, 'data': neural_status})
+        neural_status = get_stats_snapshot()['neural']
+        return json_response({'success': True, 'data': neural_status})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+        return json_response({'success': False, 'error': str(e)})
 
 @app.route('/api/stats/traffic')
 def api_traffic_stats():
     """Get real-time traffic statistics from switches"""
     try:
-        traffic_data = get_real_time_traffic_stats()
-        return jsonify({'success': True, 'data': traffic_data})
+        traffic_data = get_stats_snapshot()['traffic']
+        return json_response({'success': True, 'data': traffic_data})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+        return json_response({'success': False, 'error': str(e)})
 
 @app.route('/api/stats/latency')
 def api_latency_stats():
     """Get real-time latency statistics"""
     try:
-        latency_data = get_real_time_latency_stats()
-        return jsonify({'success': True, 'data': latency_data})
+        snapshot = get_stats_snapshot()
+        return json_response({'success': True, 'data': snapshot['latency'], 'summary': snapshot['latency_summary']})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+        return json_response({'success': False, 'error': str(e)})
 
 @app.route('/api/stats/health')
 def api_health_stats():
     """Get network health statistics"""
     try:
-        health_data = get_network_health_stats()
-        return jsonify({'success': True, 'data': health_data})
+        health_data = get_stats_snapshot()['health']
+        return json_response({'success': True, 'data': health_data})
     except Exception as e:
-        return jsonify({'success': False, 'error': str(e)})
+        return json_response({'success': False, 'error': str(e)})
 
-def execute_command(command):
-    """Execute command with proper controller communication - FIXED COMMAND ROUTING"""
+@app.route('/api/stats/all')
+def api_all_stats():
+    """Get every /stats page section in one response"""
     try:
-        print_debug(f"Dashboard executing command: '{command}'")
-        
-        if not command.strip():
-            return False, "No command provided"
-        
-        # FIXED: Handle controller methods FIRST - route directly without processing
-        if command.startswith('py net.controller.'):
-            print_debug(f"Routing controller method directly to controller: '{command}'")
-            return execute_command_via_controller(command)
-        
-        # Handle help command locally
-        elif command in ['help', 'h']:
-            help_text = """Available Dashboard Commands:
+        # The containers part is the already-encoded /api/stats/containers_all body, spliced in
+        body = get_stats_snapshot()['all_body'][:-1] + b',"containers":' + get_route_snapshot()['all'][0] + b'}'
+        return Response(body, mimetype='application/json')
+    except Exception as e:
+        return json_response({'success': False, 'error': str(e)})
+
+_HELP_TEXT = """Available Dashboard Commands:
 
 CONNECTIVITY TESTING:
 • h1 ping h5          - Test connectivity between hosts
@@ -726,64 +899,95 @@ STATUS COMMANDS:
 • links               - Show all link states
 
 Visit http://localhost:5000/stats for detailed statistics dashboard."""
-            return True, help_text
-        
-        # Handle status command locally
-        elif command in ['status', 'show']:
-            try:
-                connected, data = get_controller_data()
-                if connected:
-                    status_info = []
-                    status_info.append(f"Controller Status: CONNECTED")
-                    status_info.append(f"PID: {data.get('pid', 'Unknown')}")
-                    status_info.append(f"Last Update: {time.strftime('%H:%M:%S', time.localtime(data.get('timestamp', 0)))}")
-                    
-                    if 'data' in data and data['data'].get('health'):
-                        health = data['data']['health']
-                        status_info.append(f"Link Health: {health.get('link_health', '?')}%")
-                        status_info.append(f"Connectivity: {health.get('connectivity_health', '?')}%")
-                        status_info.append(f"Overall: {health.get('overall_status', 'Unknown')}")
-                    
-                    # Add neural optimizer status
-                    neural_status = get_neural_optimizer_status()
-                    status_info.append(f"Neural Optimizer: {neural_status['status_text']}")
-                    
-                    status_info.append(f"\nController is responding and ready for commands")
-                    status_info.append(f"Visit http://localhost:5000/stats for detailed statistics")
-                    return True, '\n'.join(status_info)
-                else:
-                    return False, "Controller Status: DISCONNECTED\n\nTo fix this:\n1. Make sure you're running the main controller\n2. Check if the controller script is active\n3. Look for fat_tree_status.json file"
-            except Exception as e:
-                return False, f"Error getting status: {str(e)}"
-        
-        # Handle links command locally for faster response
-        elif command == 'links':
-            print_debug(f"Routing links command to controller: '{command}'")
-            return execute_command_via_controller(command)
+
+def _help_command(command):
+    """help/h: list the dashboard commands"""
+    return True, _HELP_TEXT
+
+def _status_command(command):
+    """status/show: summarize controller and network state from the status file"""
+    try:
+        connected, data = get_controller_data()
+        if connected:
+            status_info = []
+            status_info.append(f"Controller Status: CONNECTED")
+            status_info.append(f"PID: {data.get('pid', 'Unknown')}")
+            status_info.append(f"Last Update: {time.strftime('%H:%M:%S', time.localtime(data.get('timestamp', 0)))}")
             
-        # Handle link up/down commands
-        elif command.startswith('link '):
-            print_debug(f"Routing link command to controller: '{command}'")
-            return execute_command_via_controller(command)
+            if 'data' in data and data['data'].get('health'):
+                health = data['data']['health']
+                status_info.append(f"Link Health: {health.get('link_health', '?')}%")
+                status_info.append(f"Connectivity: {health.get('connectivity_health', '?')}%")
+                status_info.append(f"Overall: {health.get('overall_status', 'Unknown')}")
             
-        # Handle ping commands
-        elif ' ping ' in command:
-            print_debug(f"Routing ping command to controller: '{command}'")
-            return execute_command_via_controller(command)
-        
-        # For all other commands, send to controller
-        else:
-            print_debug(f"Routing unknown command to controller: '{command}'")
-            return execute_command_via_controller(command)
+            # Add neural optimizer status
+            neural_status = get_neural_optimizer_status()
+            status_info.append(f"Neural Optimizer: {neural_status['status_text']}")
             
+            status_info.append(f"\nController is responding and ready for commands")
+            status_info.append(f"Visit http://localhost:5000/stats for detailed statistics")
+            return True, '\n'.join(status_info)
+        else:
+            return False, "Controller Status: DISCONNECTED\n\nTo fix this:\n1. Make sure you're running the main controller\n2. Check if the controller script is active\n3. Look for fat_tree_status.json file"
+    except Exception as e:
+        return False, f"Error getting status: {str(e)}"
+
+# The controller exchange uses a single request/response file pair, so controller commands run one
+# at a time on this worker instead of racing on the files from concurrent request threads
+_controller_pool = ThreadPoolExecutor(max_workers=1)
+
+# Seconds a request waits for its command; execute_command_via_controller gives up after 15s itself,
+# so this leaves room for one earlier command still in progress
+CONTROLLER_COMMAND_TIMEOUT = 30
+
+def _controller_command(command):
+    """Send command to the controller on the controller worker and wait for its (success, output)"""
+    future = _controller_pool.submit(execute_command_via_controller, command)
+    try:
+        return future.result(timeout=CONTROLLER_COMMAND_TIMEOUT)
+    except FutureTimeoutError:
+        # Drop it if it never started so it does not run after the caller has given up
+        future.cancel()
+        return False, "Controller is still busy with earlier commands; try again shortly"
+
+# Commands the dashboard answers itself; everything else (controller methods, link, links, ping, ...)
+# goes to the controller unchanged
+_LOCAL_COMMANDS = {
+    'help': _help_command,
+    'h': _help_command,
+    'status': _status_command,
+    'show': _status_command,
+}
+
+def execute_command(command):
+    """Execute command with proper controller communication - FIXED COMMAND ROUTING"""
+    try:
+        if DEBUG_OUTPUT:
+            print(f"Dashboard executing command: '{command}'")
+        
+        if not command.strip():
+            return False, "No command provided"
+        
+        handler = _LOCAL_COMMANDS.get(command, _controller_command)
+        return handler(command)
+    
     except Exception as e:
         error_msg = f"Command execution error: {str(e)}"
-        print_debug(f"Error: {error_msg}")
+        if DEBUG_OUTPUT:
+            print(f"Error: {error_msg}")
         return False, error_msg
 
+# The template has no variables, so the page is rendered, encoded and tagged once at import
+_DASHBOARD_PAGE = app.jinja_env.from_string(HTML_TEMPLATE).render().encode('utf-8')
+_DASHBOARD_PAGE_ETAG = hashlib.blake2b(_DASHBOARD_PAGE).hexdigest()[:16]
+
 @app.route('/')
 def dashboard():
-    return render_template_string(HTML_TEMPLATE)
+    response = Response(_DASHBOARD_PAGE, mimetype='text/html')
+    response.set_etag(_DASHBOARD_PAGE_ETAG)
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    return response.make_conditional(request)
 
 @app.route('/api/status')
 def api_status():
@@ -801,32 +1005,36 @@ def api_status():
                 nodes.add(node1)
                 nodes.add(node2)
         
-        return jsonify({
+        return json_response({
             "connected": True,
             "message": f"Controller running (PID: {data.get('pid')})",
             "network_data": network_data,
             "total_nodes": len(nodes)
         })
     else:
-        return jsonify({
+        return json_response({
             "connected": False,
             "message": "Controller not found or not responding"
         })
 
-@app.route('/api/topology')
-def api_topology():
-    connected, data = get_controller_data()
-    
-    # Get nodes from links first
-    if connected and 'data' in data:
-        links = data['data'].get('links', {})
-    else:
-        links = {}
-    
+# Last SVG served by /api/topology with its ETag, and the signature of the data it was built from
+_topology_cache = (None, None, None)
+
+def _topology_signature(links, additional_nodes):
+    """Hashable summary of everything the topology SVG depends on, or None if the data is not hashable"""
+    try:
+        additional = None if additional_nodes is None else tuple(
+            (layer, tuple(node_list)) for layer, node_list in additional_nodes.items())
+        signature = (tuple(links.items()), additional)
+        hash(signature)
+        return signature
+    except (TypeError, AttributeError):
+        return None
+
+def _build_topology_svg(links, additional_nodes):
+    """Build the topology SVG from the controller's links plus any extra nodes it reports"""
     nodes, connections = analyze_network_from_links(links)
     
-    # Try to get additional nodes from controller
-    additional_nodes = get_all_network_nodes_from_controller()
     if additional_nodes:
         # Merge additional nodes with discovered nodes
         for layer, additional_list in additional_nodes.items():
@@ -846,16 +1054,46 @@ def api_topology():
     
     return generate_topology_svg(nodes, connections)
 
+@app.route('/api/topology')
+def api_topology():
+    global _topology_cache
+    
+    connected, data = get_controller_data()
+    
+    # Get nodes from links first
+    if connected and 'data' in data:
+        links = data['data'].get('links', {})
+    else:
+        links = {}
+    
+    # Try to get additional nodes from controller
+    additional_nodes = get_all_network_nodes_from_controller()
+    
+    # The topology rarely changes between polls; rebuild the SVG only when its inputs do
+    signature = _topology_signature(links, additional_nodes)
+    cached_signature, svg, etag = _topology_cache
+    if signature is None or signature != cached_signature:
+        svg = _build_topology_svg(links, additional_nodes).encode('utf-8')
+        etag = hashlib.blake2b(svg).hexdigest()[:16]
+        _topology_cache = (signature, svg, etag)
+    
+    # Browsers revalidate every poll and get a bodiless 304 while the SVG is unchanged
+    response = Response(svg, mimetype='text/html')
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
 @app.route('/api/execute', methods=['POST'])
 def api_execute():
     try:
-        data = request.get_json()
+        data = json_loads(request.get_data()) if ORJSON_AVAILABLE else request.get_json()
         command = data.get('command', '')
         
         if not command:
-            return jsonify({"success": False, "error": "No command provided"})
+            return json_response({"success": False, "error": "No command provided"})
         
-        print_debug(f"Dashboard API received command: {command}")
+        if DEBUG_OUTPUT:
+            print(f"Dashboard API received command: {command}")
         success, output = execute_command(command)
         
         result = {
@@ -864,13 +1102,15 @@ def api_execute():
             "error": output if not success else None
         }
         
-        print_debug(f"Dashboard API returning: success={success}")
-        return jsonify(result)
+        if DEBUG_OUTPUT:
+            print(f"Dashboard API returning: success={success}")
+        return json_response(result)
         
     except Exception as e:
         error_msg = f"API execution error: {str(e)}"
-        print_debug(f"Error: {error_msg}")
-        return jsonify({"success": False, "error": error_msg})
+        if DEBUG_OUTPUT:
+            print(f"Error: {error_msg}")
+        return json_response({"success": False, "error": error_msg})
 
 if __name__ == '__main__':
     print("Fat-Tree Dashboard with Statistics, Container Monitoring, and Neural Optimizer Status - UPDATED VERSION")
@@ -900,4 +1140,11 @@ if __name__ == '__main__':
     print("   py net.controller.disable_neural_optimizer()")
     print("   py net.controller.neural_optimizer_status()")
     
-    app.run(host='0.0.0.0', port=5000, debug=True)
+    if WAITRESS_AVAILABLE:
+        # Keeps the browser's polling connections open; single process, so the background pollers keep running
+        print("🚀 Serving with waitress (keep-alive, 8 threads)")
+        serve(app, host='0.0.0.0', port=5000, threads=8)
+    else:
+        # No debugger/reloader: the reloader's watcher process would import this module and run
+        # a second copy of the stats pollers
+        app.run(host='0.0.0.0', port=5000, threaded=True)
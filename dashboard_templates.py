@@ -430,6 +430,7 @@ Type 'help' for available commands or 'status' to check connection.</div>
         let isExecuting = false;
         let autoLogsRefresh = null;
         let logsAutoRefreshEnabled = true;
+        let topologyEtag = null;
 
         function addLogEntry(message, type = 'info') {
             const output = document.getElementById('command-output');
@@ -586,14 +587,19 @@ Type 'help' for available commands or 'status' to check connection.</div>
                         // Update link status
                         updateLinkStatus(networkData.links);
                         
-                        // Update topology
+                        // Update topology; an unchanged ETag means the browser revalidated its cached copy
                         const topoResponse = await fetch('/api/topology');
-                        const svgContent = await topoResponse.text();
-                        document.getElementById('topology-svg').innerHTML = svgContent;
+                        const etag = topoResponse.headers.get('ETag');
+                        if (etag === null || etag !== topologyEtag) {
+                            const svgContent = await topoResponse.text();
+                            document.getElementById('topology-svg').innerHTML = svgContent;
+                            topologyEtag = etag;
+                        }
                     }
                 } else {
                     statusEl.className = 'status-indicator status-disconnected';
                     statusEl.textContent = '🔴 Controller Disconnected';
+                    topologyEtag = null;
                     document.getElementById('topology-svg').innerHTML = 
                         '<text x="500" y="300" text-anchor="middle" fill="white">Controller not connected</text>';
                 }
@@ -691,8 +697,16 @@ Type 'help' for available commands or 'status' to check connection.</div>
             addLogEntry('🌐 Dashboard initialized. Controller communication enabled.', 'info');
             updateDashboard();
             
-            // Auto refresh every 10 seconds
+            // Auto refresh every 10 seconds while the tab is visible
             autoRefresh = setInterval(updateDashboard, 10000);
+            document.addEventListener('visibilitychange', function() {
+                clearInterval(autoRefresh);
+                autoRefresh = null;
+                if (!document.hidden) {
+                    updateDashboard();
+                    autoRefresh = setInterval(updateDashboard, 10000);
+                }
+            });
             
             // Initialize logs auto-refresh
             autoLogsRefresh = setInterval(refreshLogs, 10000);
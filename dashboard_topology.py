@@ -110,16 +110,22 @@ def get_missing_host_connections(nodes, connections):
         print(f"🔍 Dashboard adding {len(missing_connections)} missing host connections (dynamic distribution)")
     return missing_connections
 
-def generate_topology_svg(nodes, connections):
-    """Generate topology SVG dynamically based on actual network data"""
+def _build_topology_template(nodes, connections):
+    """Lay out the topology SVG once for a node set and link list, leaving link states as slots
+    
+    Returns (pieces, slots, infra_indexes, extra_statuses): the SVG is pieces interleaved with the
+    slot values, slots are ('class'|'state', connection index) or ('up'|'health', None), and
+    extra_statuses are the statuses of the host connections added here
+    """
     # Add missing host connections dynamically
     missing_host_connections = get_missing_host_connections(nodes, connections)
     all_connections = connections + missing_host_connections
+    extra_statuses = tuple(conn['status'] for conn in missing_host_connections)
     
     # If we have no nodes at all, show a message
     total_nodes = sum(len(node_list) for node_list in nodes.values())
     if total_nodes == 0:
-        return '<text x="500" y="300" text-anchor="middle" fill="white" font-size="16">No network data available</text>'
+        return ['<text x="500" y="300" text-anchor="middle" fill="white" font-size="16">No network data available</text>'], [], [], extra_statuses
     
     # Calculate positions dynamically
     positions = {}
@@ -199,8 +205,15 @@ def generate_topology_svg(nodes, connections):
             for i, node in enumerate(node_list):
                 positions[node] = (x_positions[i], layer_positions[layer])
     
-    # Generate SVG with dynamic content
+    # Generate SVG with dynamic content; cut() closes the current static piece at a status slot
     svg_parts = []
+    pieces = []
+    slots = []
+    
+    def cut(slot):
+        pieces.append(''.join(svg_parts))
+        svg_parts.clear()
+        slots.append(slot)
     
     # Dynamic title based on what's actually present
     node_counts = {layer: len(nodes.get(layer, [])) for layer in ['core', 'aggregation', 'edge', 'hosts']}
@@ -230,7 +243,7 @@ def generate_topology_svg(nodes, connections):
     ''')
     
     # Draw all connections
-    for conn in all_connections:
+    for index, conn in enumerate(all_connections):
         from_node = conn['from']
         to_node = conn['to']
         
@@ -257,14 +270,15 @@ def generate_topology_svg(nodes, connections):
                 y2 += radius
             
             # Determine link class
+            svg_parts.append('\n                <line class="')
             if from_node.startswith('h') or to_node.startswith('h'):
-                link_class = 'link-host'
+                svg_parts.append('link-host')
             else:
-                link_class = 'link-up' if conn['status'] else 'link-down'
-            
-            svg_parts.append(f'''
-                <line class="{link_class}" x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}">
-                    <title>{conn['name']} - {'UP' if conn['status'] else 'DOWN'}</title>
+                cut(('class', index))
+            svg_parts.append(f'''" x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}">
+                    <title>{conn['name']} - ''')
+            cut(('state', index))
+            svg_parts.append('''</title>
                 </line>
             ''')
     
@@ -321,17 +335,19 @@ def generate_topology_svg(nodes, connections):
                     ''')
     
     # Dynamic statistics
-    infrastructure_links = [c for c in all_connections if not (c['from'].startswith('h') or c['to'].startswith('h'))]
-    total_infra_links = len(infrastructure_links)
-    up_infra_links = sum(1 for c in infrastructure_links if c['status'])
-    health = int((up_infra_links / total_infra_links * 100)) if total_infra_links > 0 else 100
+    infra_indexes = [i for i, c in enumerate(all_connections) if not (c['from'].startswith('h') or c['to'].startswith('h'))]
+    total_infra_links = len(infra_indexes)
     
     total_nodes = sum(len(node_list) for node_list in nodes.values())
     
-    svg_parts.append(f'''
+    svg_parts.append('''
         <g>
             <text x="50" y="540" fill="white" font-size="12" font-weight="bold">
-                Infrastructure Health: {up_infra_links}/{total_infra_links} links UP ({health}%)
+                Infrastructure Health: ''')
+    cut(('up', None))
+    svg_parts.append(f'/{total_infra_links} links UP (')
+    cut(('health', None))
+    svg_parts.append(f'''%)
             </text>
             <text x="50" y="560" fill="white" font-size="10">
                 🟢 UP Links  🔴 DOWN Links  🟢 Host Connections
@@ -342,4 +358,40 @@ def generate_topology_svg(nodes, connections):
         </g>
     ''')
     
+    pieces.append(''.join(svg_parts))
+    return pieces, slots, infra_indexes, extra_statuses
+
+# Layout templates by node set and link list; link state flips only re-fill the slots
+_topology_templates = {}
+_TOPOLOGY_TEMPLATE_LIMIT = 16
+
+def generate_topology_svg(nodes, connections):
+    """Generate topology SVG dynamically based on actual network data"""
+    key = (tuple((layer, tuple(node_list)) for layer, node_list in nodes.items()),
+           tuple((conn['from'], conn['to'], conn['name']) for conn in connections))
+    template = _topology_templates.get(key)
+    if template is None:
+        if len(_topology_templates) >= _TOPOLOGY_TEMPLATE_LIMIT:
+            _topology_templates.clear()
+        template = _topology_templates[key] = _build_topology_template(nodes, connections)
+    
+    pieces, slots, infra_indexes, extra_statuses = template
+    statuses = [conn['status'] for conn in connections]
+    statuses.extend(extra_statuses)
+    
+    up_infra_links = sum(1 for i in infra_indexes if statuses[i])
+    health = int((up_infra_links / len(infra_indexes) * 100)) if infra_indexes else 100
+    
+    svg_parts = [pieces[0]]
+    for (kind, index), piece in zip(slots, pieces[1:]):
+        if kind == 'class':
+            svg_parts.append('link-up' if statuses[index] else 'link-down')
+        elif kind == 'state':
+            svg_parts.append('UP' if statuses[index] else 'DOWN')
+        elif kind == 'up':
+            svg_parts.append(str(up_infra_links))
+        else:
+            svg_parts.append(str(health))
+        svg_parts.append(piece)
+    
     return ''.join(svg_parts)
@@ -8,8 +8,67 @@ import time
 import os
 import subprocess
 import re
+from flask import Response, jsonify
+
+# orjson encodes and parses in C, working on bytes directly; optional, stdlib json / jsonify are the fallback
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def json_loads(raw):
+    """Parse JSON bytes, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def json_bytes(payload):
+    """Encode payload as JSON bytes, with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+def json_response(payload):
+    """Return payload as a JSON response, encoded with orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return Response(orjson.dumps(payload), mimetype='application/json')
+    return jsonify(payload)
+
+# Parsed status file per path, reused until its mtime or size changes; callers must not mutate it
+_status_file_cache = {}
+
+def _load_status_file(file_path):
+    """Parsed JSON of a controller status file, re-read only after it changes (raises OSError if missing)"""
+    st = os.stat(file_path)
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _status_file_cache.get(file_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+    data = json_loads(raw)
+    _status_file_cache[file_path] = (key, data)
+    return data
+
+# Polls arriving within this many seconds share one lookup of the status files
+CONTROLLER_DATA_TTL = 0.5
+_controller_data_cache = (float('-inf'), (False, {}))
 
 def get_controller_data():
+    """Get data from controller status file, reusing the last result for CONTROLLER_DATA_TTL seconds"""
+    global _controller_data_cache
+    cached_at, result = _controller_data_cache
+    now = time.monotonic()
+    if now - cached_at < CONTROLLER_DATA_TTL:
+        return result
+    
+    result = _read_controller_data()
+    _controller_data_cache = (now, result)
+    return result
+
+def _read_controller_data():
     """Get data from controller status file with multiple path fallback"""
     try:
         # Try multiple status file locations
@@ -22,15 +81,13 @@ def get_controller_data():
         
         for file_path in status_files:
             try:
-                if os.path.exists(file_path):
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                    
-                    file_age = time.time() - data.get('timestamp', 0)
-                    if file_age < 60:  # File is recent (less than 1 minute old)
-                        return True, data
+                data = _load_status_file(file_path)
+                
+                file_age = time.time() - data.get('timestamp', 0)
+                if file_age < 60:  # File is recent (less than 1 minute old)
+                    return True, data
             except (json.JSONDecodeError, PermissionError, OSError):
-                continue  # Try next file location
+                continue  # Missing or unreadable; try next file location
         
         return False, {}
     except Exception as e:
@@ -349,7 +406,7 @@ def get_network_health_stats():
             if 'links' in network_data:
                 links = network_data['links']
                 health_stats['total_links'] = len(links)
-                health_stats['links_up'] = sum(1 for status in links.values() if status)
+                health_stats['links_up'] = sum(map(bool, links.values()))
                 
                 if health_stats['total_links'] > 0:
                     health_stats['link_health'] = int((health_stats['links_up'] / health_stats['total_links']) * 100)
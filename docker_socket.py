@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+docker_socket.py
+Minimal Docker Engine API client over the local UNIX socket
+Avoids forking the docker CLI (and a shell) for simple container queries
+"""
+
+import http.client
+import json
+import socket
+import threading
+from urllib.parse import quote
+
+DOCKER_SOCKET_PATH = '/var/run/docker.sock'
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection that connects to a UNIX domain socket instead of TCP"""
+
+    def __init__(self, socket_path, timeout=5):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+class DockerSocketClient:
+    """Keeps one keep-alive connection to dockerd and issues JSON GET requests on it"""
+
+    def __init__(self, socket_path=DOCKER_SOCKET_PATH, timeout=5):
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.conn = None
+        self.lock = threading.Lock()
+
+    def request(self, method, path):
+        """Send an API request and return (status, body) (raises OSError on failure)"""
+        with self.lock:
+            # Retry once on a fresh connection in case dockerd closed the idle one
+            for attempt in range(2):
+                if self.conn is None:
+                    self.conn = _UnixHTTPConnection(self.socket_path, timeout=self.timeout)
+                try:
+                    self.conn.request(method, path)
+                    response = self.conn.getresponse()
+                    return response.status, response.read()
+                except (OSError, http.client.HTTPException) as e:
+                    self.conn.close()
+                    self.conn = None
+                    if attempt == 1:
+                        raise OSError(f"Docker API request failed: {e}") from e
+
+    def get_json(self, path):
+        """GET an API path and return the decoded JSON body (raises OSError on failure)"""
+        status, body = self.request('GET', path)
+        if status != 200:
+            raise OSError(f"Docker API {path} returned HTTP {status}")
+        return json.loads(body)
+
+    def stream_json(self, path, timeout=30):
+        """Yield JSON objects from a streaming API path on its own connection (raises OSError on failure)"""
+        conn = _UnixHTTPConnection(self.socket_path, timeout=timeout)
+        try:
+            try:
+                conn.request('GET', path)
+                response = conn.getresponse()
+            except (OSError, http.client.HTTPException) as e:
+                raise OSError(f"Docker API request failed: {e}") from e
+
+            if response.status != 200:
+                raise OSError(f"Docker API {path} returned HTTP {response.status}")
+
+            # dockerd sends one JSON document per line until the stream ends
+            for line in response:
+                line = line.strip()
+                if line:
+                    yield json.loads(line)
+        finally:
+            conn.close()
+
+    def list_container_names(self, name_filter):
+        """Return names of running containers whose name contains name_filter"""
+        filters = quote(json.dumps({'name': [name_filter]}))
+        containers = self.get_json(f'/containers/json?filters={filters}')
+        return [name.lstrip('/') for container in containers for name in container.get('Names', [])]
+
+    def remove_container(self, name, force=False):
+        """Remove a container (force also kills it); a missing container is not an error"""
+        status, _ = self.request('DELETE', f'/containers/{quote(name)}?force={int(force)}')
+        if status not in (204, 404):
+            raise OSError(f"Docker API remove {name} returned HTTP {status}")
+
+    def prune_containers(self):
+        """Remove all stopped containers"""
+        status, _ = self.request('POST', '/containers/prune')
+        if status != 200:
+            raise OSError(f"Docker API prune returned HTTP {status}")
+
+# Shared client instance
+docker_client = DockerSocketClient()
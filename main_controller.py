@@ -23,6 +23,9 @@ MONITORING_AVAILABLE = False
 MONITORING_TOGGLE_AVAILABLE = False
 DASHBOARD_AVAILABLE = False
 
+# Seconds initialize() waits for every switch to connect to the controller
+SWITCH_CONNECT_TIMEOUT = 30
+
 # Import remaining modules
 try:
     from professional_sdn_testing_suite import add_professional_tests_to_controller
@@ -59,6 +62,7 @@ class FatTreeController:
         self._reset_requested = False
         self.professional_tests = None
         self.latency_optimizer = None  # Initialize here to ensure it exists
+        self.ready = threading.Event()  # Set once every switch is connected to the controller
     
     def initialize(self):
         """Initialize Fat-Tree Network with basic functionality"""
@@ -67,6 +71,11 @@ class FatTreeController:
         self.net.start()
         self.router_manager.setup_basic_routing()
         
+        # Monitoring polls OVS flow tables, so it may start as soon as the switches have connected
+        if not self.net.waitConnected(timeout=SWITCH_CONNECT_TIMEOUT):
+            print(f"⚠️ Not all switches connected after {SWITCH_CONNECT_TIMEOUT}s")
+        self.ready.set()
+        
         # FIXED: Wait for network to stabilize before initializing optimizer
         print("🔧 Network stabilizing...")
         time.sleep(3)
@@ -312,7 +312,7 @@ class NetworkStatsMonitor:
                     admission_info = {
                         'timestamp': timestamp,
                         'total_links': len(network_data.get('links', {})),
-                        'links_up': sum(1 for status in network_data.get('links', {}).values() if status),
+                        'links_up': sum(map(bool, network_data.get('links', {}).values())),
                         'link_health': network_data.get('health', {}).get('link_health', 0),
                         'connectivity_health': network_data.get('health', {}).get('connectivity_health', 0),
                         'overall_status': network_data.get('health', {}).get('overall_status', 'Unknown')
@@ -5,9 +5,10 @@ Dashboard extension for viewing network statistics
 Admission control references removed
 """
 
-from flask import Flask, jsonify, render_template_string
+from flask import Flask, jsonify, render_template
 import json
 import os
+from collections import deque
 from datetime import datetime
 
 # Enhanced HTML template with statistics
@@ -457,9 +458,12 @@ def create_stats_dashboard_app():
     """Create a Flask app for statistics dashboard"""
     app = Flask(__name__)
     
+    # Compiled once per app instead of on every request
+    stats_template = app.jinja_env.from_string(STATS_HTML_TEMPLATE)
+    
     @app.route('/stats')
     def stats_dashboard():
-        return render_template_string(STATS_HTML_TEMPLATE)
+        return render_template(stats_template)
     
     @app.route('/api/stats/traffic')
     def api_traffic_stats():
@@ -471,7 +475,8 @@ def create_stats_dashboard_app():
             if os.path.exists(traffic_file):
                 # Read latest traffic stats from CSV
                 with open(traffic_file, 'r') as f:
-                    lines = f.readlines()
+                    # Stream the file keeping only the last two lines, not a list of every line
+                    lines = deque(f, maxlen=2)
                     if len(lines) > 1:  # Skip header
                         latest_data = lines[-1].strip().split(',')
                         return jsonify({
@@ -523,9 +528,12 @@ def create_stats_dashboard_app():
 def add_stats_dashboard_to_existing_app(existing_app):
     """Add statistics routes to existing Flask app"""
     
+    # Compiled once per app instead of on every request
+    stats_template = existing_app.jinja_env.from_string(STATS_HTML_TEMPLATE)
+    
     @existing_app.route('/stats')
     def stats_dashboard():
-        return render_template_string(STATS_HTML_TEMPLATE)
+        return render_template(stats_template)
     
     @existing_app.route('/api/stats/traffic')
     def api_traffic_stats():
@@ -536,8 +544,9 @@ def add_stats_dashboard_to_existing_app(existing_app):
             
             if os.path.exists(traffic_file):
                 with open(traffic_file, 'r') as f:
-                    lines = f.readlines()
-                    if len(lines) > 1:
+                    # Stream the file keeping only the last two lines, not a list of every line
+                    lines = deque(f, maxlen=2)
+                    if len(lines) > 1:  # Skip header
                         latest_data = lines[-1].strip().split(',')
                         return jsonify({
                             'success': True,
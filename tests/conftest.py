@@ -0,0 +1,10 @@
+#!/usr/bin/env python3
+"""
+conftest.py
+Make the top-level project modules importable from the tests directory
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+test_container_fix.py
+Tests for the container_fix.py memory and CPU parsing functions
+"""
+
+import pytest
+
+from container_fix import parse_memory_value_fixed, parse_cpu_percent_fixed
+
+@pytest.mark.parametrize('memory_str, expected_mb', [
+    ('2.93k', 2.93 / 1024),   # KB to MB divides by 1024
+    ('3.68K', 3.68 / 1024),
+    ('1.5M', 1.5),
+    ('512', 512.0),           # Plain numbers are already MB
+    ('1.2G', 1228.8),
+    ('0.5t', 0.5 * 1024 * 1024),
+    ('0', 0.0),
+    ('', 0.0),
+    ('invalid', 0.0),
+])
+def test_memory_parsing(memory_str, expected_mb):
+    assert parse_memory_value_fixed(memory_str) == pytest.approx(expected_mb)
+
+@pytest.mark.parametrize('cpu_str, expected_percent', [
+    ('45.2%', 45.2),
+    (' 1.5 % ', 1.5),
+    ('0.5', 0.5),
+    ('100', 100.0),
+    ('', 0.0),
+    ('invalid', 0.0),
+])
+def test_cpu_parsing(cpu_str, expected_percent):
+    assert parse_cpu_percent_fixed(cpu_str) == pytest.approx(expected_percent)
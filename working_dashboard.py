@@ -4,13 +4,17 @@ working_dashboard.py
 Dashboard that properly communicates with the controller for command execution
 """
 
-from flask import Flask, jsonify, render_template_string, request
+from flask import Flask, Response, request
+import hashlib
 import json
 import time
 import os
 import subprocess
 import threading
 
+# orjson-backed when installed, stdlib json / jsonify otherwise
+from dashboard_utils import json_loads, json_response
+
 app = Flask(__name__)
 
 def get_controller_data():
@@ -19,13 +23,16 @@ def get_controller_data():
         status_files = ['/tmp/fat_tree_status.json', '/var/tmp/fat_tree_status.json', './fat_tree_status.json']
         
         for file_path in status_files:
-            if os.path.exists(file_path):
-                with open(file_path, 'r') as f:
-                    data = json.load(f)
-                
-                file_age = time.time() - data.get('timestamp', 0)
-                if file_age < 60:
-                    return True, data
+            try:
+                with open(file_path, 'rb') as f:
+                    raw = f.read()
+            except FileNotFoundError:
+                continue
+            data = json_loads(raw)
+            
+            file_age = time.time() - data.get('timestamp', 0)
+            if file_age < 60:
+                return True, data
         
         return False, {}
     except Exception as e:
@@ -102,17 +109,7 @@ def execute_command_via_controller(command):
         print(f"❌ {error_msg}")
         return False, error_msg
 
-def execute_command(command):
-    """Execute command with proper controller communication"""
-    try:
-        print(f"🔧 Dashboard executing command: '{command}'")
-        
-        if not command.strip():
-            return False, "No command provided"
-        
-        # Handle help command locally (no need for controller)
-        if command in ['help', 'h']:
-            help_text = """🌐 Available Dashboard Commands:
+_HELP_TEXT = """🌐 Available Dashboard Commands:
 =====================================
 
 🏓 CONNECTIVITY TESTING:
@@ -145,7 +142,18 @@ def execute_command(command):
 
 ⚠️ Note: All commands are processed by the main controller.
 Make sure it's running in another terminal!"""
-            return True, help_text
+
+def execute_command(command):
+    """Execute command with proper controller communication"""
+    try:
+        print(f"🔧 Dashboard executing command: '{command}'")
+        
+        if not command.strip():
+            return False, "No command provided"
+        
+        # Handle help command locally (no need for controller)
+        if command in ['help', 'h']:
+            return True, _HELP_TEXT
         
         # Handle status command locally
         elif command in ['status', 'show']:
@@ -965,9 +973,17 @@ Type 'help' for available commands or 'status' to check connection.</div>
 </html>
 '''
 
+# The template has no variables, so the page is rendered, encoded and tagged once at import
+_DASHBOARD_PAGE = app.jinja_env.from_string(HTML_TEMPLATE).render().encode('utf-8')
+_DASHBOARD_PAGE_ETAG = hashlib.blake2b(_DASHBOARD_PAGE).hexdigest()[:16]
+
 @app.route('/')
 def dashboard():
-    return render_template_string(HTML_TEMPLATE)
+    response = Response(_DASHBOARD_PAGE, mimetype='text/html')
+    response.set_etag(_DASHBOARD_PAGE_ETAG)
+    response.cache_control.public = True
+    response.cache_control.max_age = 60
+    return response.make_conditional(request)
 
 @app.route('/api/status')
 def api_status():
@@ -985,14 +1001,14 @@ def api_status():
                 nodes.add(node1)
                 nodes.add(node2)
         
-        return jsonify({
+        return json_response({
             "connected": True,
             "message": f"Controller running (PID: {data.get('pid')})",
             "network_data": network_data,
             "total_nodes": len(nodes)
         })
     else:
-        return jsonify({
+        return json_response({
             "connected": False,
             "message": "Controller not found or not responding"
         })
@@ -1040,7 +1056,7 @@ def api_execute():
         command = data.get('command', '')
         
         if not command:
-            return jsonify({"success": False, "error": "No command provided"})
+            return json_response({"success": False, "error": "No command provided"})
         
         print(f"🌐 Dashboard API received command: {command}")
         success, output = execute_command(command)
@@ -1052,12 +1068,12 @@ def api_execute():
         }
         
         print(f"🌐 Dashboard API returning: success={success}, output_length={len(output) if output else 0}")
-        return jsonify(result)
+        return json_response(result)
         
     except Exception as e:
         error_msg = f"API execution error: {str(e)}"
         print(f"❌ {error_msg}")
-        return jsonify({"success": False, "error": error_msg})
+        return json_response({"success": False, "error": error_msg})
 
 if __name__ == '__main__':
     print("🌐 WORKING Fat-Tree Dashboard - FULLY DYNAMIC")